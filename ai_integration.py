@@ -3,6 +3,7 @@ import os
 import base64
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 from io import BytesIO
 from pathlib import Path
 from PIL import Image
@@ -15,9 +16,18 @@ import hashlib
 # Load environment variables
 load_dotenv()
 
+# Default folder for downloaded images, resolved once at import
+_DEFAULT_IMAGES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# One pooled session for image downloads: tweets with several photos hit
+# the same host back to back, and keep-alive skips the DNS + TCP + TLS
+# handshake on each fetch after the first.
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 class AIImageDescriber:
     """
     Class to describe images using AI models (Anthropic Claude or OpenAI GPT-4 Vision).
@@ -31,12 +41,17 @@ class AIImageDescriber:
             images_folder (str, optional): Path to folder for storing downloaded images
         """
         self.ai_provider = os.getenv("AI_PROVIDER", "anthropic").lower()
-        self.images_folder = images_folder or os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
+        self.images_folder = images_folder or _DEFAULT_IMAGES_FOLDER
         
         # Create images folder if it doesn't exist
         os.makedirs(self.images_folder, exist_ok=True)
         logger.info(f"Using images folder: {self.images_folder}")
         
+        # Memoized descriptions, keyed by (image, prompt, context). Tweets
+        # frequently reuse the same media (retweets, threads), and each
+        # description is a full vision-model round trip we only want to pay once
+        self._description_cache = {}
+        
         if self.ai_provider == "anthropic":
             self.api_key = os.getenv("ANTHROPIC_API_KEY")
             self.model_name = os.getenv("ANTHROPIC_MODEL", "claude-3-opus-20240229")
@@ -199,7 +214,7 @@ class AIImageDescriber:
                         for alt_url in alternative_urls:
                             logger.debug(f"Trying alternative Nitter URL: {alt_url}")
                             try:
-                                response = requests.get(alt_url, stream=True, headers=headers, timeout=10)
+                                response = _session.get(alt_url, stream=True, headers=headers, timeout=10)
                                 if response.status_code == 200 and response.headers.get('Content-Type', '').startswith('image/'):
                                     logger.info(f"Successfully downloaded image from alternative URL: {alt_url}")
                                     return BytesIO(response.content)
@@ -211,7 +226,7 @@ class AIImageDescriber:
                 image_url = original_url
             
             logger.debug(f"Downloading image from: {image_url}")
-            response = requests.get(image_url, stream=True, headers=headers, timeout=10)
+            response = _session.get(image_url, stream=True, headers=headers, timeout=10)
             response.raise_for_status()
             
             # Check content type
@@ -233,7 +248,7 @@ class AIImageDescriber:
     
     def describe_image(self, image_path_or_url, prompt=None, tweet_context=None):
         """
-        Generate a description of an image using AI.
+        Generate a description of an image using AI, memoized per instance.
         
         Args:
             image_path_or_url (str): Path to the image file or URL
@@ -243,6 +258,19 @@ class AIImageDescriber:
         Returns:
             str: Description of the image
         """
+        cache_key = (image_path_or_url, prompt, tweet_context)
+        cached = self._description_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Reusing cached description for {image_path_or_url}")
+            return cached
+        
+        description = self._describe_image_uncached(image_path_or_url, prompt, tweet_context)
+        # Only successful descriptions are cached; errors stay retryable
+        if description and not description.startswith(("Error", "Could not")):
+            self._description_cache[cache_key] = description
+        return description
+    
+    def _describe_image_uncached(self, image_path_or_url, prompt=None, tweet_context=None):
         # Default prompt if none provided
         if not prompt:
             prompt = "Describe this image in detail, focusing on the main subjects and any text visible in the image."
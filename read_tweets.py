@@ -2,16 +2,21 @@
 import json
 import os
 import argparse
+
+try:
+    import orjson  # pragma: no cover - optional speedup
+except ImportError:
+    orjson = None
 import time
 import logging
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import io
 import subprocess
 import platform
 import tempfile
 from pathlib import Path
 from datetime import datetime
-from mutagen.mp3 import MP3
 import re
 from dotenv import load_dotenv
 
@@ -42,15 +47,33 @@ logger = logging.getLogger(__name__)
 ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
 
 # Define folder paths
-TWEETS_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tweets")
-IMAGES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
-AUDIO_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tweet_audio")
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TWEETS_FOLDER = os.path.join(_BASE_DIR, "tweets")
+IMAGES_FOLDER = os.path.join(_BASE_DIR, "images")
+AUDIO_FOLDER = os.path.join(_BASE_DIR, "tweet_audio")
 
 # Create folders if they don't exist
 os.makedirs(TWEETS_FOLDER, exist_ok=True)
 os.makedirs(IMAGES_FOLDER, exist_ok=True)
 os.makedirs(AUDIO_FOLDER, exist_ok=True)
 
+def resolve_tweet_file(json_file):
+    """Resolve a tweet JSON path, falling back to the tweets folder.
+
+    Args:
+        json_file (str): Path or bare filename of a tweet JSON file
+
+    Returns:
+        str: The resolved path (unchanged if no fallback applies)
+    """
+    if not os.path.isabs(json_file) and not os.path.exists(json_file):
+        tweets_path = os.path.join(TWEETS_FOLDER, json_file)
+        if os.path.exists(tweets_path):
+            logger.info(f"Found tweet file in tweets folder: {tweets_path}")
+            return tweets_path
+    return json_file
+
+
 class TweetReader:
     def __init__(self, json_file, api_key=None, voice_id="21m00Tcm4TlvDq8ikWAM", save_audio=False, output_dir=None, describe_images=False):
         """
@@ -66,21 +89,23 @@ class TweetReader:
         """
         # If json_file doesn't include the full path and is not in the current directory,
         # check if it's in the tweets folder
-        if not os.path.isabs(json_file) and not os.path.exists(json_file):
-            tweets_path = os.path.join(TWEETS_FOLDER, json_file)
-            if os.path.exists(tweets_path):
-                self.json_file = tweets_path
-                logger.info(f"Found tweet file in tweets folder: {tweets_path}")
-            else:
-                self.json_file = json_file
-        else:
-            self.json_file = json_file
+        self.json_file = resolve_tweet_file(json_file)
             
         self.api_key = api_key or ELEVENLABS_API_KEY  # Use environment variable if none provided
         self.voice_id = voice_id
         self.save_audio = save_audio
         self.api_url = "https://api.elevenlabs.io/v1"
         self.describe_images = describe_images
+
+        # One keep-alive session for all ElevenLabs calls: reading a whole
+        # timeline makes one TTS request per tweet, and reusing the TLS
+        # connection saves a handshake on each. Retries cover transient
+        # 429/5xx responses with backoff.
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4, pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504])))
         
         # Initialize AI image describer if enabled
         if self.describe_images:
@@ -138,8 +163,14 @@ class TweetReader:
         """
         logger.info(f"Loading tweets from {self.json_file}")
         try:
-            with open(self.json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # orjson parses several times faster than stdlib json and a big
+            # tweet dump is the largest single parse in this module
+            if orjson is not None:
+                with open(self.json_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(self.json_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             
             logger.info(f"Loaded {data.get('tweet_count', 0)} tweets from {data.get('username', 'unknown')}")
             return data
@@ -155,7 +186,7 @@ class TweetReader:
             headers = {
                 "xi-api-key": self.api_key
             }
-            response = requests.get(f"{self.api_url}/voices", headers=headers)
+            response = self.session.get(f"{self.api_url}/voices", headers=headers)
             response.raise_for_status()
             
             voices_data = response.json()
@@ -405,7 +436,7 @@ class TweetReader:
                 }
             }
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/text-to-speech/{self.voice_id}",
                 json=data,
                 headers=headers
@@ -417,6 +448,50 @@ class TweetReader:
             logger.error(f"Error converting text to speech: {e}", exc_info=True)
             return None
     
+    def text_to_speech_to_file(self, text, output_path):
+        """
+        Convert text to speech and stream the audio straight to a file.
+        
+        Chunks are written as ElevenLabs synthesizes them, so the full MP3
+        never sits in memory and playback-ready bytes hit disk sooner.
+        
+        Args:
+            text (str): Text to convert to speech
+            output_path (str): Where to write the MP3
+            
+        Returns:
+            bool: True if the file was written, False on failure
+        """
+        try:
+            headers = {
+                "xi-api-key": self.api_key,
+                "Content-Type": "application/json"
+            }
+            
+            data = {
+                "text": text,
+                "model_id": "eleven_multilingual_v2",
+                "voice_settings": {
+                    "stability": 0.5,
+                    "similarity_boost": 0.5
+                }
+            }
+            
+            with self.session.post(
+                f"{self.api_url}/text-to-speech/{self.voice_id}",
+                json=data,
+                headers=headers,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                with open(output_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
+            return True
+        except Exception as e:
+            logger.error(f"Error converting text to speech: {e}", exc_info=True)
+            return False
+    
     def get_audio_duration(self, audio_data):
         """
         Get the duration of an audio file in seconds.
@@ -433,7 +508,10 @@ class TweetReader:
                 temp_file.write(audio_data)
                 temp_path = temp_file.name
             
-            # Get duration using mutagen
+            # Get duration using mutagen (imported lazily: only the
+            # playback path probes durations, and batch TTS runs never
+            # reach it)
+            from mutagen.mp3 import MP3
             audio = MP3(temp_path)
             duration = audio.info.length
             
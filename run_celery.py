@@ -1,11 +1,50 @@
 #!/usr/bin/env python
 import os
 import sys
+
+
+def _requested_pool():
+    """Pool chosen via -P/--pool on the command line or CELERY_WORKER_POOL.
+
+    The scrape/describe/TTS pipeline is I/O-bound, so the gevent pool is a
+    good fit — but only opt-in: worker_main() never monkey-patches for us,
+    so the pool choice has to be known here, before any imports.
+    """
+    argv = sys.argv[1:]
+    for i, arg in enumerate(argv):
+        if arg in ('-P', '--pool'):
+            if i + 1 < len(argv):
+                return argv[i + 1]
+        elif arg.startswith('--pool='):
+            return arg.split('=', 1)[1]
+        elif arg.startswith('-P') and len(arg) > 2:
+            return arg[2:]
+    return os.environ.get('CELERY_WORKER_POOL')
+
+
+_pool = _requested_pool()
+
+# Green pools need the stdlib patched before anything touches socket/ssl;
+# an unpatched gevent worker serializes every requests/WebDriver call on
+# the event-loop thread. Patch first, import the app after.
+if _pool == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+elif _pool == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+
 from app import create_app, celery
 
 app = create_app()
 app.app_context().push()
 
+
 if __name__ == '__main__':
+    argv = sys.argv
+    if _pool and not any(arg == '-P' or arg.startswith('--pool')
+                         or (arg.startswith('-P') and len(arg) > 2)
+                         for arg in argv[1:]):
+        argv = [*argv, f'--pool={_pool}']
     print("Starting Celery worker...")
-    celery.worker_main(sys.argv) 
\ No newline at end of file
+    celery.worker_main(argv)
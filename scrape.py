@@ -1,6 +1,11 @@
 import json
 import time
 import os
+
+try:
+    import orjson  # pragma: no cover - optional speedup
+except ImportError:
+    orjson = None
 import argparse
 import logging
 import getpass
@@ -45,9 +50,83 @@ logger.addHandler(console_handler)
 
 logger.info("TweetScraper module initialized")
 
+# Selector tuples used in the per-tweet extraction loop.
+# Built once at module level so the hot path doesn't reallocate them per tweet.
+_SEL_TWEET_LINK = (By.CSS_SELECTOR, "a[href*='/status/']")
+_SEL_TEXT = (By.CSS_SELECTOR, "div[data-testid='tweetText']")
+_SEL_TIME = (By.CSS_SELECTOR, "time")
+_SEL_REPLY = (By.CSS_SELECTOR, "div[data-testid='reply']")
+_SEL_RT = (By.CSS_SELECTOR, "div[data-testid='retweet']")
+_SEL_LIKE = (By.CSS_SELECTOR, "div[data-testid='like']")
+_SEL_IMG = (By.CSS_SELECTOR, "img[src*='media']")
+_SEL_VIDEO = (By.CSS_SELECTOR, "div[data-testid='videoPlayer']")
+_SEL_ANY_IMG = (By.CSS_SELECTOR, "img")
+
+# Nitter equivalents
+_SEL_NITTER_LINK = (By.CSS_SELECTOR, ".tweet-link")
+_SEL_NITTER_TEXT = (By.CSS_SELECTOR, ".tweet-content")
+_SEL_NITTER_DATE = (By.CSS_SELECTOR, ".tweet-date a")
+_SEL_NITTER_STATS = (By.CSS_SELECTOR, ".tweet-stats")
+_SEL_NITTER_STILL_IMAGE = (By.CSS_SELECTOR, ".still-image")
+_SEL_NITTER_ATTACHMENT_IMG = (By.CSS_SELECTOR, ".attachment img")
+_SEL_NITTER_MEDIA_IMG = (By.CSS_SELECTOR, ".media-image img")
+_SEL_NITTER_BODY_IMG = (By.CSS_SELECTOR, ".tweet-body img:not(.emoji):not(.profile-pic)")
+_SEL_NITTER_VIDEO = (By.CSS_SELECTOR, ".video-container")
+_SEL_NITTER_POSTER = (By.CSS_SELECTOR, ".poster")
+
+# Matches the leading count in engagement-stat strings ("3", "1,204
+# replies", "1.2K", "3.4M") including the abbreviated-count suffix x.com
+# uses on popular tweets
+_STAT_COUNT_RE = re.compile(r"([\d.,]+)\s*([KM]?)", re.IGNORECASE)
+_STAT_MULTIPLIERS = {'': 1, 'K': 1_000, 'M': 1_000_000}
+
+
+# Single-round-trip field extraction for the x.com DOM. One script
+# evaluation replaces half a dozen find_element round trips per tweet.
+_JS_EXTRACT_TWEET = """
+var el = arguments[0];
+function txt(sel) {
+    var n = el.querySelector(sel);
+    return n ? n.textContent : null;
+}
+var link = el.querySelector("a[href*='/status/']");
+var time = el.querySelector("time");
+return {
+    url: link ? link.href : null,
+    text: txt("div[data-testid='tweetText']"),
+    datetime: time ? time.getAttribute("datetime") : null,
+    replies: txt("div[data-testid='reply']"),
+    retweets: txt("div[data-testid='retweet']"),
+    likes: txt("div[data-testid='like']")
+};
+"""
+
+# Nitter timestamp lives in the title attribute of the date link; one JS read
+# replaces the find_element + get_attribute round-trip pair.
+_JS_NITTER_TIMESTAMP = (
+    "var n = arguments[0].querySelector('.tweet-date a');"
+    "return n ? n.getAttribute('title') : null;"
+)
+
+
+def _parse_stat_count(text):
+    """Parse the integer count from an engagement-stat string, defaulting to 0."""
+    if not text:
+        return 0
+    match = _STAT_COUNT_RE.search(text)
+    if not match:
+        return 0
+    number, suffix = match.groups()
+    try:
+        value = float(number.replace(',', ''))
+    except ValueError:
+        return 0
+    return int(value * _STAT_MULTIPLIERS[suffix.upper()])
+
 # Define folder paths
-TWEETS_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tweets")
-IMAGES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TWEETS_FOLDER = os.path.join(_BASE_DIR, "tweets")
+IMAGES_FOLDER = os.path.join(_BASE_DIR, "images")
 TEMP_SCREENSHOTS_FOLDER = os.path.join(tempfile.gettempdir(), "tweedhat_screenshots")
 
 # Create folders if they don't exist
@@ -649,8 +728,7 @@ class TweetScraper:
                             tweet_data = self._extract_nitter_tweet_data(tweet_element)
                             if tweet_data:
                                 tweets.append(tweet_data)
-                                logger.info(f"Scraped tweet {len(tweets)} from nitter: {tweet_data['text'][:50]}...")
-                                
+
                                 # Check if we've reached the maximum number of tweets
                                 if self.max_tweets and len(tweets) >= self.max_tweets:
                                     logger.info(f"Reached maximum number of tweets ({self.max_tweets})")
@@ -719,55 +797,67 @@ class TweetScraper:
                     f.write(self.driver.page_source)
                 logger.info(f"Saved JavaScript disabled page source to {self.username}_js_disabled.html")
                 
-                # Try a different approach - use a mobile user agent
+                # Try a different approach - use a mobile user agent. Reuse
+                # the warm browser with a CDP user-agent override instead of
+                # paying a full quit + Chrome relaunch; only restart if the
+                # override itself fails.
                 logger.info("Attempting to bypass detection by using a mobile user agent...")
-                
-                # Close the current browser
-                try:
-                    self.driver.quit()
-                except Exception:
-                    pass
-                
-                # Configure new Chrome options with mobile user agent
-                chrome_options = Options()
-                if self.use_profile:
-                    chrome_options.add_argument(f"--user-data-dir={self.profile_dir}")
-                
-                # Use a mobile user agent
+
                 mobile_user_agent = "Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.6 Mobile/15E148 Safari/604.1"
-                chrome_options.add_argument(f"--user-agent={mobile_user_agent}")
-                logger.info(f"Using mobile user agent: {mobile_user_agent}")
-                
-                # Add other necessary options
-                chrome_options.add_argument("--disable-notifications")
-                chrome_options.add_argument("--disable-infobars")
-                chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-                chrome_options.add_argument("--window-size=375,812")  # iPhone X dimensions
-                
-                # Explicitly enable JavaScript
-                chrome_options.add_experimental_option("prefs", {
-                    "profile.default_content_setting_values.javascript": 1,
-                    "profile.managed_default_content_settings.javascript": 1,
-                    "profile.managed_default_content_settings.images": 1,
-                    "profile.default_content_setting_values.cookies": 1
-                })
-                
-                # Add experimental options to avoid detection
-                chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-                chrome_options.add_experimental_option("useAutomationExtension", False)
-                
+
                 try:
-                    # Initialize a new Chrome WebDriver with mobile settings
-                    self.driver = webdriver.Chrome(options=chrome_options)
-                    
-                    # Execute CDP commands to avoid detection
-                    self.driver.execute_cdp_cmd("Network.setUserAgentOverride", {
-                        "userAgent": mobile_user_agent
-                    })
-                    
+                    try:
+                        self.driver.execute_cdp_cmd("Network.setUserAgentOverride", {
+                            "userAgent": mobile_user_agent
+                        })
+                        self.driver.set_window_size(375, 812)  # iPhone X dimensions
+                        logger.info(f"Using mobile user agent on warm browser: {mobile_user_agent}")
+                    except WebDriverException as e:
+                        logger.warning(f"Could not override user agent on warm browser, restarting: {e}")
+
+                        # Close the current browser
+                        try:
+                            self.driver.quit()
+                        except Exception:
+                            pass
+
+                        # Configure new Chrome options with mobile user agent
+                        chrome_options = Options()
+                        if self.use_profile:
+                            chrome_options.add_argument(f"--user-data-dir={self.profile_dir}")
+
+                        chrome_options.add_argument(f"--user-agent={mobile_user_agent}")
+                        logger.info(f"Using mobile user agent: {mobile_user_agent}")
+
+                        # Add other necessary options
+                        chrome_options.add_argument("--disable-notifications")
+                        chrome_options.add_argument("--disable-infobars")
+                        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+                        chrome_options.add_argument("--window-size=375,812")  # iPhone X dimensions
+
+                        # Explicitly enable JavaScript
+                        chrome_options.add_experimental_option("prefs", {
+                            "profile.default_content_setting_values.javascript": 1,
+                            "profile.managed_default_content_settings.javascript": 1,
+                            "profile.managed_default_content_settings.images": 1,
+                            "profile.default_content_setting_values.cookies": 1
+                        })
+
+                        # Add experimental options to avoid detection
+                        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+                        chrome_options.add_experimental_option("useAutomationExtension", False)
+
+                        # Initialize a new Chrome WebDriver with mobile settings
+                        self.driver = webdriver.Chrome(options=chrome_options)
+
+                        # Execute CDP commands to avoid detection
+                        self.driver.execute_cdp_cmd("Network.setUserAgentOverride", {
+                            "userAgent": mobile_user_agent
+                        })
+
                     # Execute script to avoid detection
                     self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-                    
+
                     # Navigate to the profile again
                     self.driver.get(self.profile_url)
                     logger.info(f"Navigated to {self.profile_url} with mobile user agent")
@@ -782,9 +872,20 @@ class TweetScraper:
                         logger.error("Still detecting JavaScript as disabled with mobile user agent.")
                         return []
                 except Exception as e:
-                    logger.error(f"Error restarting browser with mobile user agent: {e}")
+                    logger.error(f"Error switching to mobile user agent: {e}")
                     return []
             
+            # Short-circuit before the scroll loop if the profile can't be
+            # scraped at all; no point waiting 30 seconds for tweets that
+            # will never load.
+            page_source = self.driver.page_source
+            if "This account doesn't exist" in page_source:
+                logger.error("This X.com account doesn't exist")
+                return []
+            if "These posts are protected" in page_source:
+                logger.error("This X.com account is private/protected")
+                return []
+
             # Wait for the page to load
             logger.info("Waiting for tweets to load...")
             try:
@@ -826,16 +927,21 @@ class TweetScraper:
             logger.info(f"Initial page height: {last_height}")
             
             scroll_count = 0
-            max_scrolls = 30  # Limit scrolling attempts
-            
+            # Scale the scroll budget to the requested tweet count instead of
+            # always allowing 30 attempts; X renders a handful of tweets per
+            # viewport, so a third of the target plus slack is enough.
+            if self.max_tweets:
+                max_scrolls = min(30, max(5, self.max_tweets // 3 + 3))
+            else:
+                max_scrolls = 30  # Limit scrolling attempts
+            stagnant_scrolls = 0
+
             while scroll_count < max_scrolls:
                 scroll_count += 1
-                logger.info(f"Scroll attempt {scroll_count}/{max_scrolls}")
-                
+
                 # Get all tweets currently in the DOM
                 tweet_elements = self.driver.find_elements(By.CSS_SELECTOR, "article[data-testid='tweet']")
-                logger.info(f"Found {len(tweet_elements)} tweet elements in the DOM")
-                
+
                 # Process new tweets
                 new_tweets_count = 0
                 for tweet_element in tweet_elements[len(tweets):]:
@@ -843,33 +949,41 @@ class TweetScraper:
                     if tweet_data:
                         tweets.append(tweet_data)
                         new_tweets_count += 1
-                        logger.info(f"Scraped tweet {len(tweets)}: {tweet_data['text'][:50]}...")
-                    
+
                     # Check if we've reached the maximum number of tweets
                     if self.max_tweets and len(tweets) >= self.max_tweets:
                         logger.info(f"Reached maximum number of tweets ({self.max_tweets})")
                         return tweets
-                
-                logger.info(f"Processed {new_tweets_count} new tweets in this scroll")
-                
+
+                # One summary line per scroll instead of a log entry per tweet
+                logger.info(f"Scroll {scroll_count}/{max_scrolls}: +{new_tweets_count} tweets (total {len(tweets)})")
+
+                # Bail out early if scrolling has stopped yielding tweets
+                if new_tweets_count == 0:
+                    stagnant_scrolls += 1
+                    if stagnant_scrolls >= 3:
+                        logger.info("No new tweets in 3 consecutive scrolls, ending scroll")
+                        break
+                else:
+                    stagnant_scrolls = 0
+
                 # Scroll down to load more tweets - use a more human-like scrolling
-                logger.info("Scrolling down to load more tweets...")
                 
-                # Random scroll amount to appear more human-like
+                # Random scroll amount to appear more human-like. One script
+                # round trip stages the nudge and the scroll-to-bottom instead
+                # of two execute_script calls with a sleep in between.
                 scroll_amount = random.randint(500, 1000)
-                self.driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-                time.sleep(random.uniform(0.5, 1.0))
-                
-                # Continue scrolling to the bottom
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                
+                self.driver.execute_script(
+                    "window.scrollBy(0, arguments[0]);"
+                    "setTimeout(function() { window.scrollTo(0, document.body.scrollHeight); }, arguments[1]);",
+                    scroll_amount, random.randint(500, 1000))
+
                 # Wait for new content to load with a random delay
-                logger.info("Waiting for new content to load...")
                 time.sleep(random.uniform(1.5, 3.0))
-                
+
                 # Calculate new scroll height and compare with last scroll height
                 new_height = self.driver.execute_script("return document.body.scrollHeight")
-                logger.info(f"New page height: {new_height}")
+                logger.debug(f"New page height: {new_height}")
                 
                 if new_height == last_height:
                     # Try once more with a longer wait
@@ -903,103 +1017,142 @@ class TweetScraper:
             dict: Tweet data or None if extraction failed
         """
         try:
-            # Get tweet ID from URL
-            try:
-                link_element = tweet_element.find_element(By.CSS_SELECTOR, "a[href*='/status/']")
-                tweet_url = link_element.get_attribute("href")
-                tweet_id = tweet_url.split("/status/")[1].split("?")[0]
-                logger.debug(f"Extracted tweet ID: {tweet_id}")
-            except NoSuchElementException:
-                logger.warning("Could not find tweet URL/ID")
-                tweet_id = "unknown"
-            
-            # Get tweet text
-            try:
-                text_element = tweet_element.find_element(By.CSS_SELECTOR, "div[data-testid='tweetText']")
-                text = text_element.text
-                logger.debug(f"Extracted tweet text: {text[:30]}...")
-            except NoSuchElementException:
-                logger.warning("Could not find tweet text")
-                text = ""
-            
-            # Get timestamp
-            try:
-                time_element = tweet_element.find_element(By.CSS_SELECTOR, "time")
-                timestamp = time_element.get_attribute("datetime")
-                logger.debug(f"Extracted timestamp: {timestamp}")
-            except NoSuchElementException:
-                logger.warning("Could not find tweet timestamp")
-                timestamp = ""
-            
-            # Get engagement stats
-            stats = {}
+            # Cache the bound methods as locals; this loop is the hottest path
+            find_element = tweet_element.find_element
+            find_elements = tweet_element.find_elements
+            debug = logger.isEnabledFor(logging.DEBUG)
+
+            # Batch the hot field reads (URL, text, timestamp, stats) into a
+            # single script evaluation; fall back to per-element queries if
+            # the script cannot run against this element.
+            fields = None
             try:
-                # Try to find reply count
-                reply_element = tweet_element.find_element(By.CSS_SELECTOR, "div[data-testid='reply']")
-                reply_text = reply_element.text
-                stats["replies"] = int(reply_text) if reply_text.isdigit() else 0
-            except (NoSuchElementException, ValueError) as e:
-                logger.warning(f"Could not extract reply count: {e}")
-                stats["replies"] = 0
+                fields = self.driver.execute_script(_JS_EXTRACT_TWEET, tweet_element)
+            except WebDriverException as e:
+                logger.debug(f"Batched JS extraction unavailable, using element queries: {e}")
+
+            if fields:
+                tweet_url = fields.get("url") or ""
+                if "/status/" in tweet_url:
+                    tweet_id = tweet_url.split("/status/")[1].split("?")[0]
+                else:
+                    logger.warning("Could not find tweet URL/ID")
+                    tweet_id = "unknown"
+                text = fields.get("text") or ""
+                timestamp = fields.get("datetime") or ""
+                stats = {
+                    "replies": _parse_stat_count(fields.get("replies")),
+                    "retweets": _parse_stat_count(fields.get("retweets")),
+                    "likes": _parse_stat_count(fields.get("likes")),
+                }
+            else:
+                # Get tweet ID from URL
+                try:
+                    link_element = find_element(*_SEL_TWEET_LINK)
+                    tweet_url = link_element.get_attribute("href")
+                    tweet_id = tweet_url.split("/status/")[1].split("?")[0]
+                    if debug:
+                        logger.debug(f"Extracted tweet ID: {tweet_id}")
+                except NoSuchElementException:
+                    logger.warning("Could not find tweet URL/ID")
+                    tweet_id = "unknown"
+
+                # Get tweet text
+                try:
+                    text_element = find_element(*_SEL_TEXT)
+                    text = text_element.get_attribute("textContent")
+                    if debug:
+                        logger.debug(f"Extracted tweet text: {text[:30]}...")
+                except NoSuchElementException:
+                    logger.warning("Could not find tweet text")
+                    text = ""
+
+                # Get timestamp
+                try:
+                    time_element = find_element(*_SEL_TIME)
+                    timestamp = time_element.get_attribute("datetime")
+                    if debug:
+                        logger.debug(f"Extracted timestamp: {timestamp}")
+                except NoSuchElementException:
+                    logger.warning("Could not find tweet timestamp")
+                    timestamp = ""
+
+                # Get engagement stats
+                stats = {}
+                try:
+                    # Try to find reply count
+                    reply_element = find_element(*_SEL_REPLY)
+                    reply_text = reply_element.get_attribute("textContent")
+                    stats["replies"] = _parse_stat_count(reply_text)
+                except (NoSuchElementException, ValueError) as e:
+                    logger.warning(f"Could not extract reply count: {e}")
+                    stats["replies"] = 0
                 
-            try:
-                # Try to find retweet count
-                retweet_element = tweet_element.find_element(By.CSS_SELECTOR, "div[data-testid='retweet']")
-                retweet_text = retweet_element.text
-                stats["retweets"] = int(retweet_text) if retweet_text.isdigit() else 0
-            except (NoSuchElementException, ValueError) as e:
-                logger.warning(f"Could not extract retweet count: {e}")
-                stats["retweets"] = 0
+                try:
+                    # Try to find retweet count
+                    retweet_element = find_element(*_SEL_RT)
+                    retweet_text = retweet_element.get_attribute("textContent")
+                    stats["retweets"] = _parse_stat_count(retweet_text)
+                except (NoSuchElementException, ValueError) as e:
+                    logger.warning(f"Could not extract retweet count: {e}")
+                    stats["retweets"] = 0
                 
-            try:
-                # Try to find like count
-                like_element = tweet_element.find_element(By.CSS_SELECTOR, "div[data-testid='like']")
-                like_text = like_element.text
-                stats["likes"] = int(like_text) if like_text.isdigit() else 0
-            except (NoSuchElementException, ValueError) as e:
-                logger.warning(f"Could not extract like count: {e}")
-                stats["likes"] = 0
+                try:
+                    # Try to find like count
+                    like_element = find_element(*_SEL_LIKE)
+                    like_text = like_element.get_attribute("textContent")
+                    stats["likes"] = _parse_stat_count(like_text)
+                except (NoSuchElementException, ValueError) as e:
+                    logger.warning(f"Could not extract like count: {e}")
+                    stats["likes"] = 0
             
-            logger.debug(f"Extracted stats: {stats}")
+            if debug:
+                logger.debug(f"Extracted stats: {stats}")
             
             # Get media links (images, videos)
             media_links = []
+            seen_links = set()  # set-backed membership; media_links keeps order
             has_video = False
             video_preview_url = None
+            base_url = None  # current_url costs a driver round trip; fetch at most once
             try:
                 # Check for images
-                media_elements = tweet_element.find_elements(By.CSS_SELECTOR, "img[src*='media']")
+                media_elements = find_elements(*_SEL_IMG)
                 for media in media_elements:
                     src = media.get_attribute("src")
-                    if src and "profile" not in src and src not in media_links:
+                    if src and "profile" not in src and src not in seen_links:
+                        seen_links.add(src)
                         media_links.append(src)
                 
                 # Check for videos
-                video_elements = tweet_element.find_elements(By.CSS_SELECTOR, "div[data-testid='videoPlayer']")
+                video_elements = find_elements(*_SEL_VIDEO)
                 if video_elements:
                     has_video = True
                     # Try to find video preview image
                     try:
                         # Look for the video thumbnail/preview image
-                        video_preview = video_elements[0].find_element(By.CSS_SELECTOR, "img")
+                        video_preview = video_elements[0].find_element(*_SEL_ANY_IMG)
                         if video_preview:
                             video_preview_url = video_preview.get_attribute("src")
                             if video_preview_url:
                                 # Convert relative URLs to absolute URLs if needed
                                 if video_preview_url.startswith('/'):
-                                    base_url = self.driver.current_url.split('/status')[0]
+                                    if base_url is None:
+                                        base_url = self.driver.current_url.split('/status')[0]
                                     video_preview_url = f"{base_url}{video_preview_url}"
                                 
                                 # First, remove any existing entry of this URL without the prefix
-                                if video_preview_url in media_links:
+                                if video_preview_url in seen_links:
                                     media_links.remove(video_preview_url)
                                 # Add with the prefix
+                                seen_links.add(video_preview_url)
                                 media_links.append(f"video_preview:{video_preview_url}")
                                 logger.debug(f"Found video preview image: {video_preview_url}")
                     except NoSuchElementException:
                         logger.debug("Could not find video preview image")
                     
-                logger.debug(f"Extracted {len(media_links)} media links")
+                if debug:
+                    logger.debug(f"Extracted {len(media_links)} media links")
             except Exception as e:
                 logger.warning(f"Error extracting media links: {e}")
             
@@ -1030,12 +1183,18 @@ class TweetScraper:
             dict: Tweet data or None if extraction failed
         """
         try:
+            # Cache the bound methods as locals; this loop is the hottest path
+            find_element = tweet_element.find_element
+            find_elements = tweet_element.find_elements
+            debug = logger.isEnabledFor(logging.DEBUG)
+
             # Get tweet ID and URL
             try:
-                link_element = tweet_element.find_element(By.CSS_SELECTOR, ".tweet-link")
+                link_element = find_element(*_SEL_NITTER_LINK)
                 tweet_url = link_element.get_attribute("href")
                 tweet_id = tweet_url.split("/")[-1]
-                logger.debug(f"Extracted tweet ID from nitter: {tweet_id}")
+                if debug:
+                    logger.debug(f"Extracted tweet ID from nitter: {tweet_id}")
             except NoSuchElementException:
                 logger.warning("Could not find tweet URL/ID on nitter")
                 tweet_id = "unknown"
@@ -1043,19 +1202,28 @@ class TweetScraper:
             
             # Get tweet text
             try:
-                text_element = tweet_element.find_element(By.CSS_SELECTOR, ".tweet-content")
-                text = text_element.text
-                logger.debug(f"Extracted tweet text from nitter: {text[:30]}...")
+                text_element = find_element(*_SEL_NITTER_TEXT)
+                text = text_element.get_attribute("textContent")
+                if debug:
+                    logger.debug(f"Extracted tweet text from nitter: {text[:30]}...")
             except NoSuchElementException:
                 logger.warning("Could not find tweet text on nitter")
                 text = ""
             
-            # Get timestamp
+            # Get timestamp with a single JS read
             try:
-                time_element = tweet_element.find_element(By.CSS_SELECTOR, ".tweet-date a")
-                timestamp = time_element.get_attribute("title")
-                logger.debug(f"Extracted timestamp from nitter: {timestamp}")
-            except NoSuchElementException:
+                timestamp = self.driver.execute_script(_JS_NITTER_TIMESTAMP, tweet_element)
+            except WebDriverException:
+                timestamp = None
+                try:
+                    time_element = find_element(*_SEL_NITTER_DATE)
+                    timestamp = time_element.get_attribute("title")
+                except NoSuchElementException:
+                    pass
+            if timestamp:
+                if debug:
+                    logger.debug(f"Extracted timestamp from nitter: {timestamp}")
+            else:
                 logger.warning("Could not find tweet timestamp on nitter")
                 timestamp = ""
             
@@ -1063,53 +1231,59 @@ class TweetScraper:
             stats = {}
             try:
                 # Try to find stats
-                stats_element = tweet_element.find_element(By.CSS_SELECTOR, ".tweet-stats")
-                stats_text = stats_element.text
+                stats_element = find_element(*_SEL_NITTER_STATS)
+                stats_text = stats_element.get_attribute("textContent")
                 
                 # Parse stats
                 for stat in stats_text.split('\n'):
-                    if 'repl' in stat.lower():
-                        stats["replies"] = int(stat.split()[0]) if stat.split()[0].isdigit() else 0
-                    elif 'retweet' in stat.lower():
-                        stats["retweets"] = int(stat.split()[0]) if stat.split()[0].isdigit() else 0
-                    elif 'like' in stat.lower():
-                        stats["likes"] = int(stat.split()[0]) if stat.split()[0].isdigit() else 0
+                    stat_lower = stat.lower()
+                    if 'repl' in stat_lower:
+                        stats["replies"] = _parse_stat_count(stat)
+                    elif 'retweet' in stat_lower:
+                        stats["retweets"] = _parse_stat_count(stat)
+                    elif 'like' in stat_lower:
+                        stats["likes"] = _parse_stat_count(stat)
                 
-                logger.debug(f"Extracted stats from nitter: {stats}")
+                if debug:
+                    logger.debug(f"Extracted stats from nitter: {stats}")
             except (NoSuchElementException, ValueError, IndexError) as e:
                 logger.warning(f"Could not extract stats from nitter: {e}")
                 stats = {"replies": 0, "retweets": 0, "likes": 0}
             
             # Get media links
             media_links = []
+            seen_links = set()  # set-backed membership; media_links keeps order
             video_preview_url = None
+            base_url = None  # current_url costs a driver round trip; fetch at most once
             try:
                 # Try multiple selectors to find images
                 # First try the original selector
-                media_elements = tweet_element.find_elements(By.CSS_SELECTOR, ".still-image")
-                
+                media_elements = find_elements(*_SEL_NITTER_STILL_IMAGE)
+
                 # If no images found, try alternative selectors
                 if not media_elements:
-                    media_elements = tweet_element.find_elements(By.CSS_SELECTOR, ".attachment img")
-                
+                    media_elements = find_elements(*_SEL_NITTER_ATTACHMENT_IMG)
+
                 if not media_elements:
-                    media_elements = tweet_element.find_elements(By.CSS_SELECTOR, ".media-image img")
-                
+                    media_elements = find_elements(*_SEL_NITTER_MEDIA_IMG)
+
                 if not media_elements:
-                    media_elements = tweet_element.find_elements(By.CSS_SELECTOR, ".tweet-body img:not(.emoji):not(.profile-pic)")
+                    media_elements = find_elements(*_SEL_NITTER_BODY_IMG)
                 
                 # Extract src attributes from found elements
                 for media in media_elements:
                     src = media.get_attribute("src")
-                    if src and "profile" not in src and src not in media_links:
+                    if src and "profile" not in src and src not in seen_links:
                         # Convert relative URLs to absolute URLs if needed
                         if src.startswith('/'):
-                            base_url = self.driver.current_url.split('/status')[0]
+                            if base_url is None:
+                                base_url = self.driver.current_url.split('/status')[0]
                             src = f"{base_url}{src}"
+                        seen_links.add(src)
                         media_links.append(src)
                 
                 # Also check for video elements
-                video_elements = tweet_element.find_elements(By.CSS_SELECTOR, ".video-container")
+                video_elements = find_elements(*_SEL_NITTER_VIDEO)
                 if video_elements:
                     # Mark that this tweet has a video
                     has_video = True
@@ -1117,37 +1291,41 @@ class TweetScraper:
                     # Try to find video preview image
                     try:
                         # Look for the video thumbnail/preview image
-                        video_preview = video_elements[0].find_element(By.CSS_SELECTOR, "img")
+                        video_preview = video_elements[0].find_element(*_SEL_ANY_IMG)
                         if video_preview:
                             video_preview_url = video_preview.get_attribute("src")
                             if video_preview_url:
                                 # Convert relative URLs to absolute URLs if needed
                                 if video_preview_url.startswith('/'):
-                                    base_url = self.driver.current_url.split('/status')[0]
+                                    if base_url is None:
+                                        base_url = self.driver.current_url.split('/status')[0]
                                     video_preview_url = f"{base_url}{video_preview_url}"
-                                
+
                                 # First, remove any existing entry of this URL without the prefix
-                                if video_preview_url in media_links:
+                                if video_preview_url in seen_links:
                                     media_links.remove(video_preview_url)
                                 # Add with the prefix
+                                seen_links.add(video_preview_url)
                                 media_links.append(f"video_preview:{video_preview_url}")
                                 logger.debug(f"Found video preview image: {video_preview_url}")
                     except NoSuchElementException:
                         # Try alternative selectors for video thumbnails
                         try:
-                            video_preview = video_elements[0].find_element(By.CSS_SELECTOR, ".poster")
+                            video_preview = video_elements[0].find_element(*_SEL_NITTER_POSTER)
                             if video_preview:
                                 video_preview_url = video_preview.get_attribute("src")
                                 if video_preview_url:
                                     # Convert relative URLs to absolute URLs if needed
                                     if video_preview_url.startswith('/'):
-                                        base_url = self.driver.current_url.split('/status')[0]
+                                        if base_url is None:
+                                            base_url = self.driver.current_url.split('/status')[0]
                                         video_preview_url = f"{base_url}{video_preview_url}"
                                     
                                     # First, remove any existing entry of this URL without the prefix
-                                    if video_preview_url in media_links:
+                                    if video_preview_url in seen_links:
                                         media_links.remove(video_preview_url)
                                     # Add with the prefix
+                                    seen_links.add(video_preview_url)
                                     media_links.append(f"video_preview:{video_preview_url}")
                                     logger.debug(f"Found video preview image: {video_preview_url}")
                         except NoSuchElementException:
@@ -1155,7 +1333,8 @@ class TweetScraper:
                 else:
                     has_video = False
                 
-                logger.debug(f"Extracted {len(media_links)} media links from nitter")
+                if debug:
+                    logger.debug(f"Extracted {len(media_links)} media links from nitter")
             except Exception as e:
                 logger.warning(f"Error extracting media links from nitter: {e}")
                 has_video = False
@@ -1211,10 +1390,14 @@ class TweetScraper:
             "tweets": tweets
         }
         
-        # Save to file
+        # Save to file; orjson serializes in C when available
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
             logger.info(f"Successfully saved tweets to {output_file}")
             return output_file
         except Exception as e:
@@ -1,5 +1,8 @@
 import os
-from flask import Flask
+from flask import Flask, g
+from werkzeug.local import LocalProxy
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
 from flask_login import LoginManager
 from celery import Celery
 from datetime import datetime
@@ -11,12 +14,53 @@ login_manager = LoginManager()
 login_manager.login_view = 'auth.login'
 login_manager.login_message_category = 'info'
 
+# Storage backend comes from RATELIMIT_STORAGE_URI: in-memory for
+# development, shared Redis in production so limits hold across workers.
+limiter = Limiter(key_func=get_remote_address)
+
 # Initialize Celery
 celery = Celery(__name__, 
                 broker=os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0'),
                 backend=os.environ.get('CELERY_RESULT_BACKEND', 'redis://localhost:6379/0'),
                 include=['app.tasks'])
 
+# Reuse broker connections instead of opening one per publish, and bound the
+# Redis transport's client-side connection pool.
+celery.conf.broker_pool_limit = int(os.environ.get('CELERY_BROKER_POOL_LIMIT', 10))
+celery.conf.broker_transport_options = {
+    'max_connections': int(os.environ.get('CELERY_REDIS_MAX_CONNECTIONS', 20)),
+}
+
+# The pipeline is fire-and-forget: nothing ever fetches a task result, so
+# skip result-backend writes and pin the compact JSON serializer.
+celery.conf.task_serializer = 'json'
+celery.conf.result_serializer = 'json'
+celery.conf.accept_content = ['json']
+celery.conf.task_ignore_result = True
+
+# Task/worker events each cost an extra broker publish per task transition;
+# keep them off unless a monitor (flower, celery events) is actually attached.
+_events_enabled = os.environ.get('CELERY_SEND_EVENTS', '0') == '1'
+celery.conf.worker_send_task_events = _events_enabled
+celery.conf.task_send_sent_event = _events_enabled
+
+# Mixed workload: scraping holds a browser, TTS subtasks are latency-bound
+# network calls, combining is CPU+disk. Opt-in queue routing lets each run
+# on a pool sized for its shape (e.g. -Q net -P gevent -c 50 next to
+# -Q cpu -P prefork); the default keeps everything on one queue so a
+# single `celery worker` still consumes the lot.
+if os.environ.get('CELERY_SPLIT_QUEUES', '0') == '1':
+    celery.conf.task_routes = {
+        'app.tasks.scrape_tweets_task': {'queue': 'browser'},
+        'app.tasks.generate_audio_task': {'queue': 'net'},
+        'app.tasks.generate_tweet_audio_task': {'queue': 'net'},
+        'app.tasks.finalize_audio_task': {'queue': 'net'},
+        'app.tasks.combine_audio_files_task': {'queue': 'cpu'},
+    }
+# Long tasks + eager prefetch make one slow job block queued fast ones;
+# fetch one task per worker slot at a time.
+celery.conf.worker_prefetch_multiplier = 1
+
 def create_app(config_name=None):
     if config_name is None:
         config_name = os.environ.get('FLASK_CONFIG', 'default')
@@ -27,14 +71,22 @@ def create_app(config_name=None):
     
     # Initialize extensions with app
     login_manager.init_app(app)
+    limiter.init_app(app)
     
     # Configure Celery
     celery.conf.update(app.config)
     
-    # Add context processor for template variables
+    # Add context processor for template variables. `now` is a lazy proxy
+    # memoized on flask.g, so templates that never touch it cost nothing
+    # and those that do share one datetime per request.
+    def _request_now():
+        if 'now' not in g:
+            g.now = datetime.now()
+        return g.now
+
     @app.context_processor
     def inject_now():
-        return {'now': datetime.now()}
+        return {'now': LocalProxy(_request_now)}
     
     # Register blueprints
     from app.routes import main_bp, auth_bp, jobs_bp
@@ -3,24 +3,33 @@ from wtforms import StringField, PasswordField, BooleanField, SubmitField, Integ
 from wtforms.validators import DataRequired, Email, EqualTo, ValidationError, Optional, NumberRange
 from app.models import User
 
+# Validators are stateless; share one instance per kind instead of
+# re-instantiating them for every form construction.
+_required = DataRequired()
+_email = Email()
+_optional = Optional()
+
 class LoginForm(FlaskForm):
     """Form for user login."""
-    username = StringField('Email', validators=[DataRequired(), Email()])
-    password = PasswordField('Password', validators=[DataRequired()])
+    username = StringField('Email', validators=[_required, _email])
+    password = PasswordField('Password', validators=[_required])
     remember_me = BooleanField('Remember Me')
     submit = SubmitField('Sign In')
 
 
 class RegistrationForm(FlaskForm):
     """Form for user registration."""
-    username = StringField('Email', validators=[DataRequired(), Email()])
-    password = PasswordField('Password', validators=[DataRequired()])
+    username = StringField('Email', validators=[_required, _email])
+    password = PasswordField('Password', validators=[_required])
     password2 = PasswordField(
-        'Repeat Password', validators=[DataRequired(), EqualTo('password')])
+        'Repeat Password', validators=[_required, EqualTo('password')])
     submit = SubmitField('Register')
 
     def validate_username(self, username):
         """Validate that the username is not already taken."""
+        if username.errors:
+            # Malformed email already rejected; skip the user lookup
+            return
         user = User.get_by_username(username.data)
         if user is not None:
             raise ValidationError('Please use a different email address.')
@@ -28,22 +37,22 @@ class RegistrationForm(FlaskForm):
 
 class SettingsForm(FlaskForm):
     """Form for user settings."""
-    elevenlabs_api_key = StringField('ElevenLabs API Key', validators=[Optional()])
-    anthropic_api_key = StringField('Anthropic API Key', validators=[Optional()])
-    twitter_email = StringField('Twitter Email', validators=[Optional(), Email()])
-    twitter_password = PasswordField('Twitter Password', validators=[Optional()])
-    default_voice_id = StringField('Default Voice ID', validators=[Optional()])
+    elevenlabs_api_key = StringField('ElevenLabs API Key', validators=[_optional])
+    anthropic_api_key = StringField('Anthropic API Key', validators=[_optional])
+    twitter_email = StringField('Twitter Email', validators=[_optional, _email])
+    twitter_password = PasswordField('Twitter Password', validators=[_optional])
+    default_voice_id = StringField('Default Voice ID', validators=[_optional])
     submit = SubmitField('Save Settings')
 
 
 class NewJobForm(FlaskForm):
     """Form for creating a new job."""
-    target_twitter_handle = StringField('Twitter Handle', validators=[DataRequired()])
-    max_tweets = IntegerField('Maximum Tweets', 
-                             validators=[Optional(), NumberRange(min=1, max=100)],
+    target_twitter_handle = StringField('Twitter Handle', validators=[_required])
+    max_tweets = IntegerField('Maximum Tweets',
+                             validators=[_optional, NumberRange(min=1, max=100)],
                              default=20)
     describe_images = BooleanField('Describe Images', default=False)
-    voice_id = SelectField('Voice', validators=[DataRequired()])
+    voice_id = SelectField('Voice', validators=[_required])
     submit = SubmitField('Start Job')
 
     def __init__(self, *args, **kwargs):
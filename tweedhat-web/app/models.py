@@ -1,9 +1,26 @@
+import fcntl
 import os
 import json
 import uuid
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional speedup
+    ijson = None
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import VerificationError, InvalidHashError
+except ImportError:  # pragma: no cover - optional speedup
+    PasswordHasher = None
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_login import UserMixin
 from app import login_manager
@@ -12,26 +29,232 @@ from config import Config
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Argon2id is both faster to verify and more GPU-resistant than werkzeug's
+# pbkdf2 default; werkzeug remains the fallback when argon2-cffi is absent
+# and for verifying hashes created before the switch.
+_password_hasher = (
+    PasswordHasher(time_cost=2, memory_cost=7168, parallelism=1)
+    if PasswordHasher else None
+)
+
+# Hash of an unguessable password, verified on failed username lookups so
+# login misses take about as long as hits (username enumeration by timing).
+_dummy_password_hash = None
+
+
+def dummy_password_check(password):
+    """Verify against a throwaway hash; always returns False."""
+    global _dummy_password_hash
+    if _dummy_password_hash is None:
+        secret = uuid.uuid4().hex
+        _dummy_password_hash = (_password_hasher.hash(secret)
+                                if _password_hasher
+                                else generate_password_hash(secret))
+    if _password_hasher:
+        try:
+            _password_hasher.verify(_dummy_password_hash, password)
+        except (VerificationError, InvalidHashError):
+            pass
+    else:
+        check_password_hash(_dummy_password_hash, password)
+    return False
+
+
+def _load_json(file_path):
+    """Load a JSON file, using orjson when available."""
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _dump_json(data, file_path):
+    """Write a JSON file atomically, using orjson when available.
+
+    The payload is serialized in one go (compact, these files aren't read
+    by humans on the hot path) and written to a temp file that is renamed
+    into place, so readers never see a partially written file.
+    """
+    if orjson:
+        payload = orjson.dumps(data)
+    else:
+        payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
+    # Per-pid temp name so concurrent gunicorn/Celery workers saving the
+    # same record never step on each other's half-written temp file.
+    tmp_path = f"{file_path}.tmp-{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, file_path)
+
+
+# In-process caches for User/Job get_by_id. Flask-Login resolves the
+# current user on every request and the status/download routes re-open the
+# same job file repeatedly; entries are validated against the file's mtime
+# so a hit costs one stat instead of a read+parse, and writes from other
+# processes are never served stale.
+_USER_CACHE = {}
+_JOB_CACHE = {}
+_CACHE_MAX = 256
+
+
+def _cache_put(cache, key, file_path, obj):
+    try:
+        mtime = os.stat(file_path).st_mtime_ns
+    except OSError:
+        return
+    if len(cache) >= _CACHE_MAX and key not in cache:
+        # Evict the oldest insertion; bounded and simple beats a real LRU here
+        del cache[next(iter(cache))]
+    cache[key] = (mtime, obj)
+
+
+def _cache_get(cache, key, file_path):
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    try:
+        mtime = os.stat(file_path).st_mtime_ns
+    except OSError:
+        cache.pop(key, None)
+        return None
+    if entry[0] != mtime:
+        cache.pop(key, None)
+        return None
+    return entry[1]
+
+
+def _cache_user(user):
+    _cache_put(_USER_CACHE, user.id, user.get_file_path(), user)
+
+
+@contextmanager
+def _index_write_lock(index_path):
+    """Serialize read-modify-write of a shared index file across processes.
+
+    gunicorn workers and Celery workers all rewrite the index files; an
+    unlocked load-modify-dump lets two writers race and silently drop the
+    other's entry. flock on a sidecar .lock file (never the index itself,
+    which is replaced atomically) makes writers queue instead.
+    """
+    fd = os.open(f"{index_path}.lock", os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        # Closing the fd releases the flock
+        os.close(fd)
+
+
+# Maps username -> user_id so lookups don't scan every user file. The
+# parsed index is memoized in-process and revalidated by mtime, so repeat
+# logins cost one stat instead of a read+parse (other gunicorn workers may
+# rewrite the file underneath us).
+_USERNAME_INDEX_FILE = 'username_index.json'
+_username_index_cache = (None, None)  # (st_mtime_ns, index dict)
+
+
+def _username_index_path():
+    return os.path.join(Config.USERS_DIR, _USERNAME_INDEX_FILE)
+
+
+def _cache_username_index(index):
+    global _username_index_cache
+    try:
+        mtime = os.stat(_username_index_path()).st_mtime_ns
+    except OSError:
+        return
+    _username_index_cache = (mtime, index)
+
+
+def _load_username_index():
+    """Load the username index, or None if it is missing/unreadable."""
+    path = _username_index_path()
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    cached_mtime, cached_index = _username_index_cache
+    if cached_index is not None and cached_mtime == mtime:
+        return cached_index
+    try:
+        index = _load_json(path)
+    except (ValueError, OSError):
+        logger.warning("Username index unreadable, rebuilding on next lookup")
+        return None
+    _cache_username_index(index)
+    return index
+
+
+def _update_username_index(username, user_id):
+    """Record a username -> user_id mapping in the index."""
+    with _index_write_lock(_username_index_path()):
+        index = _load_username_index() or {}
+        if index.get(username) != user_id:
+            index[username] = user_id
+            _dump_json(index, _username_index_path())
+            _cache_username_index(index)
+
+
+def _rebuild_username_index():
+    """Scan the users directory and rewrite the username index."""
+    with _index_write_lock(_username_index_path()):
+        index = {}
+        if os.path.exists(Config.USERS_DIR):
+            # scandir avoids the extra stat per entry that listdir+join incurs
+            with os.scandir(Config.USERS_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.name != _USERNAME_INDEX_FILE and entry.is_file():
+                        try:
+                            data = _load_json(entry.path)
+                        except (ValueError, OSError):
+                            continue
+                        if 'username' in data and 'user_id' in data:
+                            index[data['username']] = data['user_id']
+        _dump_json(index, _username_index_path())
+        _cache_username_index(index)
+        return index
+
 class User(UserMixin):
     """User model for authentication and storing user data in JSON files."""
     
     def __init__(self, id=None, username=None, password_hash=None, created_at=None, 
                  last_login=None, settings=None, combined_audio_file=None):
-        self.id = id or str(uuid.uuid4())
+        # .hex keeps ids filesystem- and URL-safe at 32 chars instead of
+        # 36; legacy hyphenated ids keep working since lookups go by the
+        # stored value.
+        self.id = id or uuid.uuid4().hex
         self.username = username
         self.password_hash = password_hash
-        self.created_at = created_at or datetime.now().isoformat()
-        self.last_login = last_login or datetime.now().isoformat()
+        now_iso = datetime.now().isoformat()
+        self.created_at = created_at or now_iso
+        self.last_login = last_login or now_iso
         self.settings = settings or {}
         self.combined_audio_file = combined_audio_file
     
     def set_password(self, password):
         """Set password hash."""
-        self.password_hash = generate_password_hash(password)
-    
+        if _password_hasher:
+            self.password_hash = _password_hasher.hash(password)
+        else:
+            self.password_hash = generate_password_hash(password)
+
     def check_password(self, password):
         """Check password against hash."""
-        return check_password_hash(self.password_hash, password)
+        if _password_hasher and self.password_hash.startswith('$argon2'):
+            try:
+                _password_hasher.verify(self.password_hash, password)
+            except (VerificationError, InvalidHashError):
+                return False
+            if _password_hasher.check_needs_rehash(self.password_hash):
+                self.password_hash = _password_hasher.hash(password)
+                self.save()
+            return True
+        # Legacy werkzeug hash; upgrade to argon2 on a successful check
+        if check_password_hash(self.password_hash, password):
+            if _password_hasher:
+                self.password_hash = _password_hasher.hash(password)
+                self.save()
+            return True
+        return False
     
     def get_file_path(self):
         """Get the path to the user's JSON file."""
@@ -50,25 +273,62 @@ class User(UserMixin):
         }
         
         # Store settings as plaintext
-        with open(self.get_file_path(), 'w') as f:
-            json.dump(user_data, f, indent=2)
+        _dump_json(user_data, self.get_file_path())
+        _cache_user(self)
+        _update_username_index(self.username, self.id)
     
     def update_last_login(self):
-        """Update the last login timestamp."""
+        """Update the last login timestamp.
+
+        Patches only last_login into the on-disk record rather than
+        re-serializing the whole object through save(), so a login can't
+        clobber settings written concurrently by a worker and skips the
+        cache/index bookkeeping nothing else changed.
+        """
         self.last_login = datetime.now().isoformat()
-        self.save()
+        file_path = self.get_file_path()
+        try:
+            data = _load_json(file_path)
+        except (ValueError, OSError):
+            self.save()
+            return
+        data['last_login'] = self.last_login
+        _dump_json(data, file_path)
+        # Cache what is now on disk — a User built from the fresh read plus
+        # the patched timestamp. Caching self here would pin its possibly
+        # stale settings against the new mtime, reintroducing the very
+        # clobber the read-patch-write above avoids.
+        _cache_user(User(
+            id=data['user_id'],
+            username=data['username'],
+            password_hash=data['password_hash'],
+            created_at=data['created_at'],
+            last_login=data['last_login'],
+            settings=data['settings'],
+            combined_audio_file=data.get('combined_audio_file')
+        ))
     
     def get_setting(self, key):
         """Get a setting value."""
-        if key not in self.settings:
-            return None
-        
         return self.settings.get(key)
     
     def set_setting(self, key, value):
-        """Set a setting value."""
-        self.settings[key] = value
-        self.save()
+        """Set a setting value, saving only if it actually changed."""
+        if self.settings.get(key) != value:
+            self.settings[key] = value
+            self.save()
+
+    def update_settings(self, changes):
+        """Apply several setting changes with a single save.
+
+        Resubmitting the settings form unchanged is common; skipping the
+        no-op save avoids a pointless rewrite and cache/index churn.
+        """
+        changed = {key: value for key, value in changes.items()
+                   if self.settings.get(key) != value}
+        if changed:
+            self.settings.update(changed)
+            self.save()
     
     def set_combined_audio_file(self, file_path):
         """Set the combined audio file path."""
@@ -77,15 +337,18 @@ class User(UserMixin):
     
     @staticmethod
     def get_by_id(user_id):
-        """Get a user by ID."""
+        """Get a user by ID, served from the mtime-validated cache."""
         file_path = os.path.join(Config.USERS_DIR, f"{user_id}.json")
+        cached = _cache_get(_USER_CACHE, user_id, file_path)
+        if cached is not None:
+            return cached
+
         if not os.path.exists(file_path):
             return None
         
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        data = _load_json(file_path)
         
-        return User(
+        user = User(
             id=data['user_id'],
             username=data['username'],
             password_hash=data['password_hash'],
@@ -94,46 +357,148 @@ class User(UserMixin):
             settings=data['settings'],
             combined_audio_file=data.get('combined_audio_file')
         )
+        _cache_user(user)
+        return user
     
     @staticmethod
     def get_by_username(username):
-        """Get a user by username."""
-        # Since we don't have an index, we need to scan all files
+        """Get a user by username via the username index."""
         if not os.path.exists(Config.USERS_DIR):
             return None
-            
-        for filename in os.listdir(Config.USERS_DIR):
-            if filename.endswith('.json'):
-                file_path = os.path.join(Config.USERS_DIR, filename)
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                
-                if data['username'] == username:
-                    return User(
-                        id=data['user_id'],
-                        username=data['username'],
-                        password_hash=data['password_hash'],
-                        created_at=data['created_at'],
-                        last_login=data['last_login'],
-                        settings=data['settings'],
-                        combined_audio_file=data.get('combined_audio_file')
-                    )
-        
+
+        index = _load_username_index()
+        if index is None:
+            index = _rebuild_username_index()
+
+        user_id = index.get(username)
+        if user_id is None:
+            # Misses are rare (typos, or an entry lost to an older
+            # unlocked writer); rebuild from the user files and retry
+            # once before concluding the name really is unknown, so a
+            # dropped entry can't lock a registered user out
+            index = _rebuild_username_index()
+            user_id = index.get(username)
+            if user_id is None:
+                return None
+
+        user = User.get_by_id(user_id)
+        if user is None or user.username != username:
+            # Stale entry (user file removed or renamed); rebuild and retry
+            index = _rebuild_username_index()
+            user_id = index.get(username)
+            return User.get_by_id(user_id) if user_id else None
+
+        return user
+
+
+# Maps user_id -> [job_id, ...] so dashboard renders read only the user's
+# own jobs instead of parsing every file in the jobs directory.
+_JOBS_INDEX_FILE = '_by_user.json'
+
+
+def _jobs_index_path():
+    return os.path.join(Config.JOBS_DIR, _JOBS_INDEX_FILE)
+
+
+def _load_jobs_index():
+    """Load the user->jobs index, or None if it is missing/unreadable."""
+    path = _jobs_index_path()
+    if not os.path.exists(path):
+        return None
+    try:
+        return _load_json(path)
+    except (ValueError, OSError):
+        logger.warning("Jobs index unreadable, rebuilding on next lookup")
         return None
 
 
+def _update_jobs_index(user_id, job_id):
+    """Record a job under its owner in the user->jobs index."""
+    with _index_write_lock(_jobs_index_path()):
+        index = _load_jobs_index() or {}
+        job_ids = index.setdefault(user_id, [])
+        if job_id not in job_ids:
+            job_ids.append(job_id)
+            _dump_json(index, _jobs_index_path())
+
+
+def _remove_from_jobs_index(user_id, job_id):
+    """Drop a deleted job from the user->jobs index."""
+    with _index_write_lock(_jobs_index_path()):
+        index = _load_jobs_index()
+        if index and job_id in index.get(user_id, []):
+            index[user_id].remove(job_id)
+            _dump_json(index, _jobs_index_path())
+
+
+def _scan_job_owner(file_path):
+    """Read just (job_id, user_id) from a job file.
+
+    With ijson installed the parse stops after the two leading keys, so
+    jobs carrying long audio_files arrays don't pay for a full parse.
+    """
+    if ijson:
+        job_id = user_id = None
+        with open(file_path, 'rb') as f:
+            for key, value in ijson.kvitems(f, ''):
+                if key == 'job_id':
+                    job_id = value
+                elif key == 'user_id':
+                    user_id = value
+                if job_id is not None and user_id is not None:
+                    break
+        return job_id, user_id
+    data = _load_json(file_path)
+    return data.get('job_id'), data.get('user_id')
+
+
+def _rebuild_jobs_index():
+    """Scan the jobs directory and rewrite the user->jobs index."""
+    index = {}
+    if not os.path.exists(Config.JOBS_DIR):
+        return index
+    with _index_write_lock(_jobs_index_path()):
+        with os.scandir(Config.JOBS_DIR) as entries:
+            job_files = [entry.path for entry in entries
+                         if entry.name.endswith('.json')
+                         and entry.name != _JOBS_INDEX_FILE and entry.is_file()]
+
+        # For big directories, overlap file reads across a few threads
+        # (the GIL is released during read()); below the threshold the
+        # pool costs more than it saves.
+        if len(job_files) > 64:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                parsed = list(executor.map(_scan_job_owner, job_files))
+        else:
+            parsed = [_scan_job_owner(file_path) for file_path in job_files]
+
+        for job_id, user_id in parsed:
+            if job_id is not None and user_id is not None:
+                index.setdefault(user_id, []).append(job_id)
+        _dump_json(index, _jobs_index_path())
+        return index
+
+
 class Job:
     """Job model for tracking tweet scraping and audio generation jobs."""
-    
+
+    # Job listings load many instances at once; slots keep each one a
+    # fixed-size allocation instead of carrying a per-instance __dict__.
+    __slots__ = ('id', 'user_id', 'status', 'created_at', 'updated_at',
+                 'target_twitter_handle', 'max_tweets', 'describe_images',
+                 'voice_id', 'tweet_file', 'audio_files', 'error',
+                 '_last_progress_write', '_audio_index')
+
     def __init__(self, id=None, user_id=None, status="pending", created_at=None, 
                  updated_at=None, target_twitter_handle=None, max_tweets=20, 
                  describe_images=False, voice_id=None, tweet_file=None, 
                  audio_files=None, error=None):
-        self.id = id or str(uuid.uuid4())
+        self.id = id or uuid.uuid4().hex
         self.user_id = user_id
         self.status = status
-        self.created_at = created_at or datetime.now().isoformat()
-        self.updated_at = updated_at or datetime.now().isoformat()
+        now_iso = datetime.now().isoformat()
+        self.created_at = created_at or now_iso
+        self.updated_at = updated_at or now_iso
         self.target_twitter_handle = target_twitter_handle
         self.max_tweets = max_tweets
         self.describe_images = describe_images
@@ -141,19 +506,32 @@ class Job:
         self.tweet_file = tweet_file
         self.audio_files = audio_files or []
         self.error = error
+        self._last_progress_write = 0.0
+        self._audio_index = None
     
     def get_file_path(self):
         """Get the path to the job's JSON file."""
-        return os.path.join(Config.DATA_DIR, 'jobs', f"{self.id}.json")
+        return os.path.join(Config.JOBS_DIR, f"{self.id}.json")
+
+    @property
+    def audio_index(self):
+        """Basename -> full path map over audio_files, built lazily."""
+        if (self._audio_index is None
+                or len(self._audio_index) != len(self.audio_files)):
+            self._audio_index = {os.path.basename(path): path
+                                 for path in self.audio_files}
+        return self._audio_index
     
     def save(self):
         """Save job data to JSON file."""
+        # update_status/update_progress already stamp updated_at; reuse it
+        # instead of formatting a fresh timestamp on every write.
         job_data = {
             'job_id': self.id,
             'user_id': self.user_id,
             'status': self.status,
             'created_at': self.created_at,
-            'updated_at': datetime.now().isoformat(),
+            'updated_at': self.updated_at,
             'target_twitter_handle': self.target_twitter_handle,
             'max_tweets': self.max_tweets,
             'describe_images': self.describe_images,
@@ -163,13 +541,17 @@ class Job:
             'error': self.error
         }
         
-        # Ensure jobs directory exists
-        jobs_dir = os.path.join(Config.DATA_DIR, 'jobs')
-        os.makedirs(jobs_dir, exist_ok=True)
-        
-        with open(self.get_file_path(), 'w') as f:
-            json.dump(job_data, f, indent=2)
-    
+        _dump_json(job_data, self.get_file_path())
+        _cache_put(_JOB_CACHE, self.id, self.get_file_path(), self)
+        _update_jobs_index(self.user_id, self.id)
+
+    def delete(self):
+        """Remove the job file and de-register it from the user index."""
+        _JOB_CACHE.pop(self.id, None)
+        _remove_from_jobs_index(self.user_id, self.id)
+        if os.path.exists(self.get_file_path()):
+            os.remove(self.get_file_path())
+
     def update_status(self, status, error=None):
         """Update job status."""
         old_status = self.status
@@ -182,70 +564,98 @@ class Job:
             logger.info(f"Job {self.id} (@{self.target_twitter_handle}) status changed: {old_status} -> {status}")
         self.save()
     
+    def update_progress(self, message, min_interval=1.0):
+        """Record progress on a running job, writing to disk at most once per interval.
+
+        The scraping/audio loop reports progress per tweet; debouncing keeps
+        that from rewriting the job file on every iteration.
+        """
+        self.status = "processing"
+        self.error = message
+        self.updated_at = datetime.now().isoformat()
+        now = time.time()
+        if now - self._last_progress_write >= min_interval:
+            self._last_progress_write = now
+            self.save()
+    
     def add_audio_file(self, audio_file):
         """Add an audio file to the job."""
         if audio_file not in self.audio_files:
             self.audio_files.append(audio_file)
             self.save()
     
-    @staticmethod
-    def get_by_id(job_id):
-        """Get a job by ID."""
-        file_path = os.path.join(Config.DATA_DIR, 'jobs', f"{job_id}.json")
-        if not os.path.exists(file_path):
-            return None
-        
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        
-        return Job(
+    @classmethod
+    def _from_dict(cls, data):
+        """Build a Job from its on-disk dict representation."""
+        return cls(
             id=data['job_id'],
             user_id=data['user_id'],
             status=data['status'],
             created_at=data['created_at'],
             updated_at=data['updated_at'],
             target_twitter_handle=data['target_twitter_handle'],
-            max_tweets=data['max_tweets'],
-            describe_images=data['describe_images'],
-            voice_id=data['voice_id'],
-            tweet_file=data['tweet_file'],
-            audio_files=data['audio_files'],
-            error=data['error']
+            max_tweets=data.get('max_tweets', 20),
+            describe_images=data.get('describe_images', False),
+            voice_id=data.get('voice_id'),
+            tweet_file=data.get('tweet_file'),
+            audio_files=data.get('audio_files'),
+            error=data.get('error')
         )
+
+    @staticmethod
+    def get_by_id(job_id):
+        """Get a job by ID, served from the mtime-validated cache."""
+        file_path = os.path.join(Config.JOBS_DIR, f"{job_id}.json")
+        cached = _cache_get(_JOB_CACHE, job_id, file_path)
+        if cached is not None:
+            return cached
+
+        if not os.path.exists(file_path):
+            return None
+
+        job = Job._from_dict(_load_json(file_path))
+        _cache_put(_JOB_CACHE, job_id, file_path, job)
+        return job
     
     @staticmethod
     def get_by_user_id(user_id):
-        """Get all jobs for a user."""
-        jobs = []
-        jobs_dir = os.path.join(Config.DATA_DIR, 'jobs')
-        
-        if not os.path.exists(jobs_dir):
-            return jobs
-            
-        for filename in os.listdir(jobs_dir):
-            if filename.endswith('.json'):
-                file_path = os.path.join(jobs_dir, filename)
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                
-                if data['user_id'] == user_id:
-                    jobs.append(Job(
-                        id=data['job_id'],
-                        user_id=data['user_id'],
-                        status=data['status'],
-                        created_at=data['created_at'],
-                        updated_at=data['updated_at'],
-                        target_twitter_handle=data['target_twitter_handle'],
-                        max_tweets=data['max_tweets'],
-                        describe_images=data['describe_images'],
-                        voice_id=data['voice_id'],
-                        tweet_file=data['tweet_file'],
-                        audio_files=data['audio_files'],
-                        error=data['error']
-                    ))
-        
+        """Get all jobs for a user via the user->jobs index."""
+        if not os.path.exists(Config.JOBS_DIR):
+            return []
+
+        index = _load_jobs_index()
+        if index is None:
+            index = _rebuild_jobs_index()
+
+        job_ids = index.get(user_id, [])
+        jobs = [job for job in map(Job.get_by_id, job_ids) if job is not None]
+        if len(jobs) != len(job_ids):
+            # Stale entries (job files removed out of band); rewrite the index
+            index = _rebuild_jobs_index()
+            jobs = [job for job in map(Job.get_by_id, index.get(user_id, []))
+                    if job is not None]
         return jobs
 
+    @staticmethod
+    def user_has_audio(user_id):
+        """Cheap precheck: does the user have any completed job with audio?
+
+        Walks the user's job ids from the index and stops at the first hit,
+        so it avoids materializing every job the way get_by_user_id does.
+        """
+        if not os.path.exists(Config.JOBS_DIR):
+            return False
+
+        index = _load_jobs_index()
+        if index is None:
+            index = _rebuild_jobs_index()
+
+        for job_id in index.get(user_id, []):
+            job = Job.get_by_id(job_id)
+            if job is not None and job.status == 'completed' and job.audio_files:
+                return True
+        return False
+
 @login_manager.user_loader
 def load_user(user_id):
     """Load user by ID for Flask-Login."""
@@ -1,19 +1,115 @@
+import hashlib
+import logging
 import os
-from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, send_file
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, send_file, send_from_directory
 from flask_login import login_user, logout_user, login_required, current_user
+from werkzeug.exceptions import NotFound
 from werkzeug.urls import url_parse
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
-from app.models import User, Job
+from app import limiter
+from app.models import User, Job, dummy_password_check
 from app.forms import LoginForm, RegistrationForm, SettingsForm, NewJobForm
-from app.tasks import scrape_tweets_task, generate_audio_task, combine_audio_files_task
+from app.tasks import (scrape_tweets_task, generate_audio_task,
+                       combine_audio_files_task, _TWEET_IDX_RE)
 from config import Config
 
+logger = logging.getLogger(__name__)
+
 # Create blueprints
 main_bp = Blueprint('main', __name__)
 auth_bp = Blueprint('auth', __name__)
 jobs_bp = Blueprint('jobs', __name__)
 
+# Celery's .delay() blocks on a broker round trip; publishing from a small
+# pool lets the HTTP response return first. A failed publish just leaves
+# the job 'pending' for the process_pending_jobs backstop to pick up.
+_dispatch_pool = ThreadPoolExecutor(max_workers=4,
+                                    thread_name_prefix='task-dispatch')
+
+
+def _dispatch_task(task, *args):
+    def _publish():
+        try:
+            task.delay(*args)
+        except Exception as e:
+            logger.warning(f"Deferred dispatch of {task.name} failed: {e}")
+    _dispatch_pool.submit(_publish)
+
+# In-process cache for the ElevenLabs voice list, keyed by a digest of the
+# API key. The list rarely changes, so paying a 200-600 ms upstream round
+# trip on every /voices and /new render is wasted time. Expired entries are
+# served stale while a daemon thread refreshes them, so only the very first
+# request per key ever blocks on the upstream call.
+_voices_cache = {}
+_voices_refreshing = set()
+_voices_lock = threading.Lock()
+_VOICES_CACHE_TTL = 600  # seconds
+
+# One pooled session for ElevenLabs calls: keep-alive skips the TLS
+# handshake on repeat fetches, and transient upstream hiccups get a
+# couple of backed-off retries.
+_eleven_session = requests.Session()
+_eleven_session.mount('https://', HTTPAdapter(
+    pool_connections=4, pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3)))
+
+
+def _fetch_voices(api_key, cache_key):
+    response = _eleven_session.get("https://api.elevenlabs.io/v1/voices",
+                                   headers={"xi-api-key": api_key})
+    response.raise_for_status()
+    voices = response.json().get("voices", [])
+    _voices_cache[cache_key] = (time.monotonic(), voices)
+    return voices
+
+
+def _refresh_voices(api_key, cache_key):
+    """Background refresh of an expired cache entry; keeps stale on failure."""
+    try:
+        _fetch_voices(api_key, cache_key)
+    except Exception as e:
+        logger.warning(f"Voice list refresh failed: {e}")
+    finally:
+        with _voices_lock:
+            _voices_refreshing.discard(cache_key)
+
+
+def _prefetch_voices(api_key):
+    """Warm the voice cache in the background; best-effort only."""
+    try:
+        _get_voices(api_key)
+    except Exception as e:
+        logger.debug(f"Voice prefetch failed: {e}")
+
+
+def _get_voices(api_key):
+    """Fetch the ElevenLabs voice list for an API key, cached with a TTL.
+
+    Raises on upstream errors for uncached keys; callers keep their
+    existing error handling.
+    """
+    cache_key = hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+    cached = _voices_cache.get(cache_key)
+    if cached:
+        if time.monotonic() - cached[0] >= _VOICES_CACHE_TTL:
+            with _voices_lock:
+                already_refreshing = cache_key in _voices_refreshing
+                if not already_refreshing:
+                    _voices_refreshing.add(cache_key)
+            if not already_refreshing:
+                threading.Thread(target=_refresh_voices,
+                                 args=(api_key, cache_key),
+                                 daemon=True).start()
+        return cached[1]
+
+    return _fetch_voices(api_key, cache_key)
+
 # Main routes
 @main_bp.route('/')
 @main_bp.route('/index')
@@ -37,36 +133,33 @@ def dashboard():
 @login_required
 def combine_audio_files():
     """Combine all audio files from all jobs into a single file."""
-    # Get all jobs for the user
-    jobs = Job.get_by_user_id(current_user.id)
-    
-    # Check if there are any completed jobs with audio files
-    has_audio_files = False
-    for job in jobs:
-        if job.status == 'completed' and job.audio_files:
-            has_audio_files = True
-            break
-    
-    if not has_audio_files:
+    # Stop-at-first-hit precheck instead of materializing every job
+    if not Job.user_has_audio(current_user.id):
         return jsonify({'success': False, 'error': 'No audio files found in your jobs.'}), 400
     
     try:
-        # Start the task to combine audio files
-        # We'll run this synchronously for immediate feedback
-        output_file = combine_audio_files_task(current_user.id)
-        
-        if output_file:
-            return jsonify({
-                'success': True, 
-                'file_path': output_file,
-                'message': 'Audio files combined successfully!'
-            })
-        else:
-            return jsonify({'success': False, 'error': 'Failed to combine audio files.'}), 500
+        # Run the combine on a worker; the client polls for completion
+        # instead of holding a gunicorn worker for the whole combine.
+        task = combine_audio_files_task.delay(current_user.id)
+        return jsonify({'success': True, 'task_id': task.id}), 202
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@main_bp.route('/combine-audio/<task_id>/status')
+@login_required
+def combine_audio_status(task_id):
+    """Report the state of a combine-audio task."""
+    result = combine_audio_files_task.AsyncResult(task_id)
+    payload = {'state': result.state}
+    if result.successful():
+        payload['success'] = result.result is not None
+        payload['file_path'] = result.result
+    elif result.failed():
+        payload['success'] = False
+    return jsonify(payload)
+
+
 @main_bp.route('/download-combined-audio')
 @login_required
 def download_combined_audio():
@@ -76,7 +169,9 @@ def download_combined_audio():
         return redirect(url_for('main.dashboard'))
     
     filename = os.path.basename(current_user.combined_audio_file)
-    return send_file(current_user.combined_audio_file, as_attachment=True, download_name=f"tweedhat_combined_{filename}")
+    return send_file(current_user.combined_audio_file, mimetype='audio/mpeg',
+                     conditional=True, as_attachment=True,
+                     download_name=f"tweedhat_combined_{filename}")
 
 
 @main_bp.route('/settings', methods=['GET', 'POST'])
@@ -86,18 +181,20 @@ def settings():
     form = SettingsForm()
     
     if form.validate_on_submit():
-        # Update user settings
+        # Collect all changed settings and write the user file once
+        changes = {}
         if form.elevenlabs_api_key.data:
-            current_user.set_setting('elevenlabs_api_key', form.elevenlabs_api_key.data)
+            changes['elevenlabs_api_key'] = form.elevenlabs_api_key.data
         if form.anthropic_api_key.data:
-            current_user.set_setting('anthropic_api_key', form.anthropic_api_key.data)
+            changes['anthropic_api_key'] = form.anthropic_api_key.data
         if form.twitter_email.data:
-            current_user.set_setting('twitter_email', form.twitter_email.data)
+            changes['twitter_email'] = form.twitter_email.data
         if form.twitter_password.data:
-            current_user.set_setting('twitter_password', form.twitter_password.data)
+            changes['twitter_password'] = form.twitter_password.data
         if form.default_voice_id.data:
-            current_user.set_setting('default_voice_id', form.default_voice_id.data)
-        
+            changes['default_voice_id'] = form.default_voice_id.data
+        current_user.update_settings(changes)
+
         flash('Your settings have been updated.', 'success')
         return redirect(url_for('main.settings'))
     
@@ -123,15 +220,7 @@ def list_voices():
         return redirect(url_for('main.settings'))
     
     try:
-        headers = {
-            "xi-api-key": api_key
-        }
-        response = requests.get("https://api.elevenlabs.io/v1/voices", headers=headers)
-        response.raise_for_status()
-        
-        voices_data = response.json()
-        voices = voices_data.get("voices", [])
-        
+        voices = _get_voices(api_key)
         return render_template('voices.html', title='Available Voices', voices=voices)
     except Exception as e:
         flash(f'Error listing voices: {str(e)}', 'danger')
@@ -140,21 +229,32 @@ def list_voices():
 
 # Authentication routes
 @auth_bp.route('/login', methods=['GET', 'POST'])
+@limiter.limit("5 per minute", methods=['POST'])
 def login():
     """User login page."""
     if current_user.is_authenticated:
         return redirect(url_for('main.dashboard'))
-    
+
     form = LoginForm()
     if form.validate_on_submit():
         user = User.get_by_username(form.username.data)
+        if user is None:
+            # Burn a comparable hash check so unknown usernames don't
+            # answer faster than known ones
+            dummy_password_check(form.password.data)
         if user is None or not user.check_password(form.password.data):
             flash('Invalid username or password', 'danger')
             return redirect(url_for('auth.login'))
         
         login_user(user, remember=form.remember_me.data)
         user.update_last_login()
-        
+
+        # Warm the voice cache now so /new and /voices render without an
+        # upstream round trip later in the session
+        api_key = user.get_setting('elevenlabs_api_key')
+        if api_key:
+            _dispatch_pool.submit(_prefetch_voices, api_key)
+
         next_page = request.args.get('next')
         if not next_page or url_parse(next_page).netloc != '':
             next_page = url_for('main.dashboard')
@@ -172,6 +272,7 @@ def logout():
 
 
 @auth_bp.route('/register', methods=['GET', 'POST'])
+@limiter.limit("5 per minute", methods=['POST'])
 def register():
     """User registration page."""
     if current_user.is_authenticated:
@@ -201,20 +302,17 @@ def new_job():
         flash('Please set your ElevenLabs API key in settings.', 'warning')
         return redirect(url_for('main.settings'))
     
+    # Kick off the voices lookup first so a cache-miss fetch overlaps
+    # with form construction/validation instead of serializing after it
+    voices_future = _dispatch_pool.submit(_get_voices, elevenlabs_api_key)
+
     # Create form and populate voice choices
     form = NewJobForm()
     
     try:
-        # Get available voices from ElevenLabs
-        headers = {
-            "xi-api-key": elevenlabs_api_key
-        }
-        response = requests.get("https://api.elevenlabs.io/v1/voices", headers=headers)
-        response.raise_for_status()
-        
-        voices_data = response.json()
-        voices = voices_data.get("voices", [])
-        
+        # Get available voices from ElevenLabs (cached per API key)
+        voices = voices_future.result(timeout=12)
+
         # Populate voice choices
         form.voice_id.choices = [(voice['voice_id'], voice['name']) for voice in voices]
         
@@ -237,8 +335,8 @@ def new_job():
         )
         job.save()
         
-        # Start the job
-        scrape_tweets_task.delay(job.id)
+        # Start the job without blocking the response on the broker publish
+        _dispatch_task(scrape_tweets_task, job.id)
         
         flash('Job created successfully!', 'success')
         return redirect(url_for('jobs.view', job_id=job.id))
@@ -268,12 +366,23 @@ def status(job_id):
     if not job or job.user_id != current_user.id:
         return jsonify({'error': 'Job not found'}), 404
     
-    return jsonify({
+    # The UI polls this every couple of seconds but the answer rarely
+    # changes; a weak ETag lets unchanged polls come back as empty 304s
+    etag = hashlib.md5(
+        f"{job.status}|{job.updated_at}|{len(job.audio_files)}".encode()
+    ).hexdigest()
+    if etag in request.if_none_match:
+        return '', 304
+
+    response = jsonify({
         'status': job.status,
         'updated_at': job.updated_at,
         'audio_files': job.audio_files,
         'error': job.error
     })
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 
 @jobs_bp.route('/<job_id>/download/<filename>')
@@ -286,18 +395,22 @@ def download_audio(job_id, filename):
         flash('Job not found.', 'danger')
         return redirect(url_for('main.dashboard'))
     
-    # Find the full path of the audio file in the job's audio_files list
-    file_path = None
-    for audio_file in job.audio_files:
-        if os.path.basename(audio_file) == filename:
-            file_path = audio_file
-            break
-    
-    if not file_path or not os.path.exists(file_path):
+    # Resolve the requested basename against the job's audio files before
+    # touching the filesystem, so bogus filenames never cost a stat;
+    # send_from_directory handles a since-deleted file without a separate
+    # exists() round trip
+    file_path = job.audio_index.get(filename)
+    if not file_path:
+        flash('File not found.', 'danger')
+        return redirect(url_for('jobs.view', job_id=job.id))
+
+    try:
+        return send_from_directory(os.path.dirname(file_path), filename,
+                                   mimetype='audio/mpeg', conditional=True,
+                                   as_attachment=True)
+    except NotFound:
         flash('File not found.', 'danger')
         return redirect(url_for('jobs.view', job_id=job.id))
-    
-    return send_file(file_path, as_attachment=True)
 
 
 @jobs_bp.route('/<job_id>/stream/<filename>')
@@ -309,17 +422,19 @@ def stream_audio(job_id, filename):
     if not job or job.user_id != current_user.id:
         return jsonify({'error': 'Job not found'}), 404
     
-    # Find the full path of the audio file in the job's audio_files list
-    file_path = None
-    for audio_file in job.audio_files:
-        if os.path.basename(audio_file) == filename:
-            file_path = audio_file
-            break
-    
-    if not file_path or not os.path.exists(file_path):
+    # Resolve the requested basename against the job's audio files before
+    # touching the filesystem, so bogus filenames never cost a stat
+    file_path = job.audio_index.get(filename)
+    if not file_path:
+        return jsonify({'error': 'File not found'}), 404
+
+    # conditional=True enables Range (seeking) and 304 revalidation
+    try:
+        return send_from_directory(os.path.dirname(file_path), filename,
+                                   mimetype='audio/mpeg', conditional=True,
+                                   as_attachment=False)
+    except NotFound:
         return jsonify({'error': 'File not found'}), 404
-    
-    return send_file(file_path, as_attachment=False)
 
 
 @jobs_bp.route('/<job_id>/audio_files')
@@ -331,25 +446,17 @@ def get_audio_files(job_id):
     if not job or job.user_id != current_user.id:
         return jsonify({'error': 'Job not found'}), 404
     
-    # Extract filenames and sort them by tweet index
+    # Extract filenames and sort them by tweet index (format:
+    # tweet_INDEX_ID.mp3); unparseable names sink to the end
     audio_files = []
     for audio_file in job.audio_files:
         filename = os.path.basename(audio_file)
-        # Extract the index from the filename (format: tweet_INDEX_ID.mp3)
-        try:
-            index = int(filename.split('_')[1])
-            audio_files.append({
-                'index': index,
-                'filename': filename,
-                'url': url_for('jobs.stream_audio', job_id=job.id, filename=filename)
-            })
-        except (IndexError, ValueError):
-            # If we can't extract the index, just add it to the end
-            audio_files.append({
-                'index': 999,
-                'filename': filename,
-                'url': url_for('jobs.stream_audio', job_id=job.id, filename=filename)
-            })
+        m = _TWEET_IDX_RE.search(filename)
+        audio_files.append({
+            'index': int(m.group(1)) if m else 1 << 30,
+            'filename': filename,
+            'url': url_for('jobs.stream_audio', job_id=job.id, filename=filename)
+        })
     
     # Sort by index
     audio_files.sort(key=lambda x: x['index'])
@@ -367,16 +474,19 @@ def delete_job(job_id):
         flash('Job not found.', 'danger')
         return redirect(url_for('main.dashboard'))
     
-    # Delete associated files
-    if job.tweet_file and os.path.exists(job.tweet_file):
-        os.remove(job.tweet_file)
-    
-    for audio_file in job.audio_files:
-        if os.path.exists(audio_file):
-            os.remove(audio_file)
-    
-    # Delete job file
-    os.remove(job.get_file_path())
+    # A job's audio files all live in one per-job directory, so one rmtree
+    # sweep replaces a per-file unlink loop; ignore_errors covers files
+    # (or the whole dir) already gone
+    if job.audio_files:
+        shutil.rmtree(os.path.dirname(job.audio_files[0]), ignore_errors=True)
+    if job.tweet_file:
+        try:
+            os.unlink(job.tweet_file)
+        except FileNotFoundError:
+            pass
+
+    # Delete job file and de-register it from the user index
+    job.delete()
     
     flash('Job deleted successfully.', 'success')
     return redirect(url_for('main.dashboard')) 
\ No newline at end of file
@@ -1,29 +1,53 @@
+import hashlib
 import os
+import shutil
+import subprocess
 import sys
 import json
 import time
 import logging
+import re
+import traceback
 from datetime import datetime
-from celery import shared_task
+from operator import itemgetter
+
+from celery import shared_task, chord
 from pydub import AudioSegment
 
 from app import celery
-from app.models import Job, User
+from app.models import Job, User, _load_json
 from config import Config
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(os.path.join(Config.BASE_DIR, "tweedhat-web.log")),
-        logging.StreamHandler()
-    ]
-)
+# Set up logging. Workers default to WARNING: per-record formatting and
+# the serialized file write are measurable on big jobs, and per-tweet
+# chatter lives at DEBUG anyway. TWEEDHAT_LOG_LEVEL=INFO restores the
+# task start/end lines when debugging a deployment. Guarded so re-imports
+# (web tier, process_pending_jobs) don't open a second log file handle.
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=os.environ.get('TWEEDHAT_LOG_LEVEL', 'WARNING'),
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(os.path.join(Config.BASE_DIR, "tweedhat-web.log")),
+            logging.StreamHandler()
+        ]
+    )
 logger = logging.getLogger(__name__)
 
-# Add the parent directory to sys.path to import the original modules
-sys.path.append(os.path.dirname(Config.BASE_DIR))
+# Opt-in durability for audio writes. The default skips fsync: the concat
+# step re-reads every file anyway, and a crash just re-runs the task, so
+# page-cache write-back is enough outside of flaky-disk deployments.
+_FSYNC_AUDIO = os.environ.get('TWEEDHAT_FSYNC', '0') == '1'
+
+# Per-tweet audio files are named tweet_<index>_<tweetid>.mp3; one
+# precompiled pattern recovers the index for ordering
+_TWEET_IDX_RE = re.compile(r'tweet_(\d+)_')
+
+# Add the parent directory to sys.path to import the original modules;
+# only once, so repeated imports don't keep growing the search path
+_PARENT_DIR = os.path.dirname(Config.BASE_DIR)
+if _PARENT_DIR not in sys.path:
+    sys.path.append(_PARENT_DIR)
 
 # Import the original modules
 try:
@@ -35,6 +59,93 @@ except ImportError as e:
     raise
 
 
+# TweetReader instances memoized per worker process. Construction builds a
+# pooled HTTP session (and, with describe_images, an AIImageDescriber), so
+# reusing one per (api key, voice, describe flag) keeps the TLS connection
+# to ElevenLabs alive across all tweets of a job and across jobs on the
+# same worker instead of re-handshaking per subtask.
+_READERS = {}
+_READERS_MAX = 32
+
+
+def _get_reader(job, api_key, output_dir):
+    key = (api_key, job.voice_id, job.describe_images)
+    reader = _READERS.get(key)
+    if reader is None:
+        reader = TweetReader(
+            json_file=job.tweet_file,
+            api_key=api_key,
+            voice_id=job.voice_id,
+            save_audio=True,
+            output_dir=output_dir,
+            describe_images=job.describe_images
+        )
+        if len(_READERS) >= _READERS_MAX:
+            _READERS.pop(next(iter(_READERS)))
+        _READERS[key] = reader
+    return reader
+
+
+def _cached_tts(reader, text, voice_id):
+    """Synthesize text through a content-addressed cache.
+
+    The same tweet text and voice yields byte-identical audio, so repeat
+    jobs (retweets, re-scrapes, boilerplate) are served from disk instead
+    of paying the ElevenLabs call and its per-character cost.
+
+    Returns:
+        str: Path to the cached mp3, or None if synthesis failed
+    """
+    key = hashlib.sha256(f"{voice_id}|{text}".encode()).hexdigest()
+    cache_path = os.path.join(Config.AUDIO_CACHE_DIR, f"{key}.mp3")
+    if os.path.exists(cache_path):
+        return cache_path
+
+    os.makedirs(Config.AUDIO_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{cache_path}.tmp-{os.getpid()}"
+    # Stream chunks straight into the tmp file; the full MP3 never sits
+    # in worker memory
+    if not reader.text_to_speech_to_file(text, tmp_path):
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        return None
+    if _FSYNC_AUDIO:
+        fd = os.open(tmp_path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    os.replace(tmp_path, cache_path)
+    return cache_path
+
+
+def _materialize_audio(cache_path, filename):
+    """Place the cached audio at the job's filename without copying bytes.
+
+    Duplicate texts within a job (retweets, sign-off boilerplate) resolve
+    to the same cache entry; a hard link makes each per-tweet file free
+    and is atomic, so a crashed worker never leaves a truncated mp3 in
+    job.audio_files. The cross-filesystem copy fallback goes through a
+    .part file and os.replace for the same guarantee.
+    """
+    try:
+        os.link(cache_path, filename)
+    except FileExistsError:
+        pass
+    except OSError:
+        part = f"{filename}.part"
+        shutil.copyfile(cache_path, part)
+        if _FSYNC_AUDIO:
+            fd = os.open(part, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        os.replace(part, filename)
+
+
 @shared_task
 def scrape_tweets_task(job_id):
     """
@@ -73,7 +184,7 @@ def scrape_tweets_task(job_id):
         output_path = os.path.join(Config.TWEETS_DIR, output_filename)
         
         # Initialize scraper
-        logger.info(f"Job {job_id}: Initializing TweetScraper for @{job.target_twitter_handle}")
+        logger.debug(f"Job {job_id}: Initializing TweetScraper for @{job.target_twitter_handle}")
         scraper = TweetScraper(
             username=job.target_twitter_handle,
             headless=True,
@@ -106,7 +217,6 @@ def scrape_tweets_task(job_id):
         generate_audio_task.delay(job_id)
         
     except Exception as e:
-        import traceback
         error_traceback = traceback.format_exc()
         error_msg = str(e)
         logger.error(f"Error scraping tweets for job {job_id}: {error_msg}\n{error_traceback}")
@@ -161,22 +271,16 @@ def generate_audio_task(job_id):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_dir = os.path.join(Config.AUDIO_DIR, f"{job.target_twitter_handle}_{timestamp}")
         os.makedirs(output_dir, exist_ok=True)
-        logger.info(f"Job {job_id}: Created output directory for audio files: {output_dir}")
-        
-        # Initialize tweet reader
-        logger.info(f"Job {job_id}: Initializing TweetReader with voice ID: {job.voice_id}")
-        reader = TweetReader(
-            json_file=job.tweet_file,
-            api_key=elevenlabs_api_key,
-            voice_id=job.voice_id,
-            save_audio=True,
-            output_dir=output_dir,
-            describe_images=job.describe_images
-        )
+        logger.debug(f"Job {job_id}: Created output directory for audio files: {output_dir}")
         
-        # Load tweets
+        # Load tweets once here; the parsed dicts ride along in the
+        # subtask signatures so no worker re-reads the file.
         logger.info(f"Job {job_id}: Loading tweets from {job.tweet_file}")
-        data = reader.load_tweets()
+        try:
+            data = _load_json(job.tweet_file)
+        except (ValueError, OSError) as e:
+            logger.error(f"Job {job_id}: Could not read {job.tweet_file}: {e}")
+            data = None
         if not data:
             error_msg = f"Failed to load tweets from {job.tweet_file}"
             logger.error(f"Job {job_id}: {error_msg}")
@@ -190,58 +294,146 @@ def generate_audio_task(job_id):
             job.update_status("failed", error_msg)
             return
         
-        logger.info(f"Job {job_id}: Processing {len(tweets)} tweets for audio generation")
-        
-        # Process each tweet
-        for i, tweet in enumerate(tweets):
-            try:
-                logger.info(f"Job {job_id}: Processing tweet {i+1}/{len(tweets)}")
-                
-                # Format the tweet for speech
-                text = reader.format_tweet_for_speech(tweet)
-                
-                # Generate audio
-                logger.info(f"Job {job_id}: Generating audio for tweet {i+1}")
-                audio_data = reader.text_to_speech(text)
-                if not audio_data:
-                    logger.warning(f"Job {job_id}: Failed to generate audio for tweet {i+1}")
-                    continue
-                
-                # Save audio
-                tweet_id = tweet.get('id', f"unknown_{i}")
-                filename = os.path.join(output_dir, f"tweet_{i}_{tweet_id}.mp3")
-                
-                with open(filename, 'wb') as f:
-                    f.write(audio_data)
-                
-                logger.info(f"Job {job_id}: Saved audio for tweet {i+1} to {filename}")
-                
-                # Add audio file to job
-                job.add_audio_file(filename)
-                
-                # Update job status
-                job.update_status("processing", f"Processed {i+1}/{len(tweets)} tweets")
-                
-            except Exception as e:
-                import traceback
-                error_traceback = traceback.format_exc()
-                error_msg = f"Error processing tweet {i+1}: {str(e)}"
-                logger.error(f"Job {job_id}: {error_msg}\n{error_traceback}")
-                # Continue with next tweet
-        
-        # Update job status
-        logger.info(f"Job {job_id}: Completed audio generation for all tweets")
-        job.update_status("completed")
-        
+        logger.info(f"Job {job_id}: Dispatching {len(tweets)} tweets for parallel audio generation")
+
+        # Each tweet is independent, so fan the synthesis out across the
+        # worker pool and let the chord callback finish the job once all
+        # subtasks have returned. len() and the signature constructor are
+        # hoisted out of the comprehension; at hundreds of tweets the
+        # repeated lookups are pure interpreter overhead.
+        total = len(tweets)
+        sig = generate_tweet_audio_task.s
+        header = [
+            sig(job_id, i, tweet, output_dir, total)
+            for i, tweet in enumerate(tweets)
+        ]
+        chord(header)(finalize_audio_task.s(job_id))
+
     except Exception as e:
-        import traceback
         error_traceback = traceback.format_exc()
         error_msg = str(e)
         logger.error(f"Error generating audio for job {job_id}: {error_msg}\n{error_traceback}")
         job.update_status("failed", error_msg)
 
 
+@shared_task(ignore_result=False)
+def generate_tweet_audio_task(job_id, index, tweet, output_dir, total):
+    """
+    Task to synthesize audio for a single tweet.
+
+    Runs as part of the chord dispatched by generate_audio_task; results
+    feed the chord callback, so ignore_result is switched back on for
+    this task only.
+
+    Returns:
+        str: Path to the written audio file, or None if synthesis failed
+    """
+    job = Job.get_by_id(job_id)
+    if not job:
+        logger.error(f"Job {job_id} not found")
+        return None
+
+    try:
+        user = User.get_by_id(job.user_id)
+        reader = _get_reader(job, user.get_setting('elevenlabs_api_key'),
+                             output_dir)
+
+        text = reader.format_tweet_for_speech(tweet)
+        cache_path = _cached_tts(reader, text, job.voice_id)
+        if not cache_path:
+            logger.warning(f"Job {job_id}: Failed to generate audio for tweet {index+1}")
+            return None
+
+        tweet_id = tweet.get('id', f"unknown_{index}")
+        filename = os.path.join(output_dir, f"tweet_{index}_{tweet_id}.mp3")
+        _materialize_audio(cache_path, filename)
+
+        logger.debug(f"Job {job_id}: Saved audio for tweet {index+1}/{total} to {filename}")
+
+        # Debounced progress note for the status poller; each worker
+        # writes at most once per interval rather than once per tweet
+        job.update_progress(f"Synthesized tweet {index+1}/{total}", min_interval=2.0)
+        return filename
+    except Exception as e:
+        error_traceback = traceback.format_exc()
+        logger.error(f"Job {job_id}: Error processing tweet {index+1}: {str(e)}\n{error_traceback}")
+        return None
+
+
 @shared_task
+def finalize_audio_task(results, job_id):
+    """
+    Chord callback: record the produced audio files and close out the job.
+
+    The job's audio_files list is assigned here in one save rather than
+    appended from each subtask, which would race across workers.
+    """
+    job = Job.get_by_id(job_id)
+    if not job:
+        logger.error(f"Job {job_id} not found")
+        return
+
+    audio_files = [path for path in results if path]
+    job.audio_files = audio_files
+    if audio_files:
+        logger.info(f"Job {job_id}: Completed audio generation "
+                    f"({len(audio_files)}/{len(results)} tweets)")
+        job.update_status("completed")
+    else:
+        job.update_status("failed", "No audio could be generated for any tweet")
+
+
+def _silence_mp3(reference_file):
+    """Path to a cached 500 ms silent MP3 inserted between combined clips.
+
+    The clip is rendered at the reference file's sample rate and channel
+    count — stream copy is only sound for homogeneous streams, so a
+    silence at pydub's 11025 Hz default would put a format change at
+    every splice point. One cached clip per distinct shape.
+    """
+    try:
+        ref = AudioSegment.from_mp3(reference_file)
+    except Exception as e:
+        logger.warning(f"Could not probe {reference_file} for silence format: {e}")
+        return None
+    path = os.path.join(
+        Config.AUDIO_CACHE_DIR,
+        f'silence_500ms_{ref.frame_rate}_{ref.channels}ch.mp3'
+    )
+    if not os.path.exists(path):
+        try:
+            os.makedirs(Config.AUDIO_CACHE_DIR, exist_ok=True)
+            AudioSegment.silent(
+                duration=500, frame_rate=ref.frame_rate
+            ).set_channels(ref.channels).export(path, format='mp3')
+        except Exception as e:
+            logger.warning(f"Could not create silence clip: {e}")
+            return None
+    return path
+
+
+def _combine_with_ffmpeg(audio_files, output_file):
+    """Concatenate MP3s with ffmpeg's concat demuxer.
+
+    Stream copy (-c copy) splices the existing MP3 frames without ever
+    decoding them, so the combine is disk-bound instead of paying a full
+    decode/re-encode of every clip.
+    """
+    list_path = f"{output_file}.files.txt"
+    with open(list_path, 'w') as f:
+        for path in audio_files:
+            escaped = path.replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+    try:
+        subprocess.run(
+            ['ffmpeg', '-y', '-f', 'concat', '-safe', '0',
+             '-i', list_path, '-c', 'copy', output_file],
+            check=True, capture_output=True)
+    finally:
+        os.unlink(list_path)
+
+
+@shared_task(ignore_result=False)
 def combine_audio_files_task(user_id):
     """
     Task to combine all audio files from all jobs into a single file.
@@ -268,20 +460,14 @@ def combine_audio_files_task(user_id):
     all_audio_files = []
     for job in jobs:
         if job.status == 'completed' and job.audio_files:
-            # Sort audio files by index (extracted from filename)
+            # Sort audio files by index (format: tweet_INDEX_ID.mp3);
+            # unparseable names sink to the end
             sorted_files = []
             for audio_file in job.audio_files:
-                filename = os.path.basename(audio_file)
-                try:
-                    # Extract the index from the filename (format: tweet_INDEX_ID.mp3)
-                    index = int(filename.split('_')[1])
-                    sorted_files.append((index, audio_file))
-                except (IndexError, ValueError):
-                    # If we can't extract the index, just add it to the end
-                    sorted_files.append((999, audio_file))
-            
-            # Sort by index
-            sorted_files.sort(key=lambda x: x[0])
+                m = _TWEET_IDX_RE.search(audio_file)
+                sorted_files.append((int(m.group(1)) if m else 1 << 30,
+                                     audio_file))
+            sorted_files.sort(key=itemgetter(0))
             
             # Add to the list of all audio files
             all_audio_files.extend([file_path for _, file_path in sorted_files])
@@ -300,12 +486,40 @@ def combine_audio_files_task(user_id):
         
         # Output file path
         output_file = os.path.join(output_dir, f"combined_{timestamp}.mp3")
-        
-        # Combine audio files
-        combined = AudioSegment.empty()
+
+        # Prefer ffmpeg's concat demuxer: no decode, no re-encode
+        if shutil.which('ffmpeg'):
+            silence_path = None
+            manifest = []
+            for audio_file in all_audio_files:
+                if not os.path.exists(audio_file):
+                    logger.warning(f"File not found: {audio_file}")
+                    continue
+                if manifest:
+                    # Match the silence to the first clip's format once
+                    if silence_path is None:
+                        silence_path = _silence_mp3(manifest[0]) or False
+                    if silence_path:
+                        manifest.append(silence_path)
+                manifest.append(audio_file)
+            if manifest:
+                try:
+                    _combine_with_ffmpeg(manifest, output_file)
+                    user.set_combined_audio_file(output_file)
+                    logger.info(f"Combined audio file created successfully: {output_file}")
+                    return output_file
+                except (subprocess.CalledProcessError, OSError) as e:
+                    logger.warning(f"ffmpeg concat failed, falling back to pydub: {e}")
+
+        # Fallback: decode via pydub, but splice the PCM in one pass.
+        # Repeated `combined += audio` recopies the accumulated buffer on
+        # every append (O(N^2) bytes moved); collecting segments and
+        # joining their raw_data once moves each byte a single time.
+        pieces = []
+        pauses = {}
         
         for i, audio_file in enumerate(all_audio_files):
-            logger.info(f"Processing file {i+1}/{len(all_audio_files)}: {audio_file}")
+            logger.debug(f"Processing file {i+1}/{len(all_audio_files)}: {audio_file}")
             
             if not os.path.exists(audio_file):
                 logger.warning(f"File not found: {audio_file}")
@@ -315,20 +529,46 @@ def combine_audio_files_task(user_id):
                 # Load audio file
                 audio = AudioSegment.from_mp3(audio_file)
                 
-                # Add a short pause between audio files (500ms)
-                if i > 0:
-                    combined += AudioSegment.silent(duration=500)
+                # Add a short pause between audio files (500ms); one silent
+                # buffer per (rate, channels) shape, reused across the loop
+                # instead of allocating and zero-filling ~44 kB per gap
+                if pieces:
+                    shape = (audio.frame_rate, audio.channels)
+                    pause = pauses.get(shape)
+                    if pause is None:
+                        pause = AudioSegment.silent(
+                            duration=500, frame_rate=audio.frame_rate
+                        ).set_channels(audio.channels)
+                        pauses[shape] = pause
+                    pieces.append(pause)
+                pieces.append(audio)
                 
-                # Append to combined audio
-                combined += audio
-                
-                logger.info(f"Added file {i+1} to combined audio")
+                logger.debug(f"Added file {i+1} to combined audio")
             except Exception as e:
                 logger.error(f"Error processing audio file {audio_file}: {e}")
         
-        # Export combined audio
+        if not pieces:
+            logger.error("No decodable audio files to combine")
+            return None
+        
+        # The one-pass raw_data join is only valid when every piece shares
+        # one PCM shape; mixed-format inputs (the reason this fallback
+        # exists) go through pydub's append, which resamples as it splices
+        shapes = {(p.frame_rate, p.sample_width, p.channels) for p in pieces}
+        if len(shapes) == 1:
+            combined = pieces[0]._spawn(b''.join(p.raw_data for p in pieces))
+        else:
+            logger.debug(f"Mixed audio shapes {shapes}; splicing via pydub append")
+            combined = pieces[0]
+            for piece in pieces[1:]:
+                combined = combined.append(piece, crossfade=0)
+        
+        # Export combined audio. VBR quality 7 roughly halves libmp3lame
+        # CPU versus pydub's default and is transparent for spoken voice;
+        # -threads 0 lets ffmpeg pick its own thread count.
         logger.info(f"Exporting combined audio to {output_file}")
-        combined.export(output_file, format="mp3")
+        combined.export(output_file, format="mp3",
+                        parameters=['-q:a', '7', '-threads', '0'])
         
         # Update user's combined audio file
         user.set_combined_audio_file(output_file)
@@ -340,5 +580,3 @@ def combine_audio_files_task(user_id):
         return None
 
 
-# Import User model here to avoid circular imports
-from app.models import User 
\ No newline at end of file
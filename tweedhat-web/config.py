@@ -12,10 +12,15 @@ class Config:
     # User data
     USERS_DIR = os.path.join(DATA_DIR, 'users')
     
+    # Job data
+    JOBS_DIR = os.path.join(DATA_DIR, 'jobs')
+    
     # Content directories
     TWEETS_DIR = os.path.join(DATA_DIR, 'tweets')
     IMAGES_DIR = os.path.join(DATA_DIR, 'images')
     AUDIO_DIR = os.path.join(DATA_DIR, 'audio')
+    # Content-addressed TTS cache shared across jobs and users
+    AUDIO_CACHE_DIR = os.path.join(DATA_DIR, 'audio_cache')
     
     # Session configuration
     PERMANENT_SESSION_LIFETIME = timedelta(days=7)
@@ -24,17 +29,25 @@ class Config:
     CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL') or 'redis://localhost:6379/0'
     CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND') or 'redis://localhost:6379/0'
     
-    # Rate limiting
-    RATELIMIT_DEFAULT = "5 per minute"
-    RATELIMIT_STORAGE_URL = "memory://"
+    # Rate limiting: a permissive global safety net; sensitive routes get
+    # stricter per-route limits where they are defined.
+    RATELIMIT_DEFAULT = "200 per minute"
+    RATELIMIT_STORAGE_URI = "memory://"
+
+    # Hand audio transfers to the front-end server (X-Sendfile /
+    # X-Accel-Redirect) instead of streaming bytes through the worker.
+    # Only enable when running behind nginx/Apache configured for it.
+    USE_X_SENDFILE = os.environ.get('USE_X_SENDFILE', '0') == '1'
     
     # Ensure directories exist
     @staticmethod
     def init_app(app):
         os.makedirs(Config.USERS_DIR, exist_ok=True)
+        os.makedirs(Config.JOBS_DIR, exist_ok=True)
         os.makedirs(Config.TWEETS_DIR, exist_ok=True)
         os.makedirs(Config.IMAGES_DIR, exist_ok=True)
         os.makedirs(Config.AUDIO_DIR, exist_ok=True)
+        os.makedirs(Config.AUDIO_CACHE_DIR, exist_ok=True)
 
 
 class DevelopmentConfig(Config):
@@ -45,8 +58,9 @@ class ProductionConfig(Config):
     DEBUG = False
     SECRET_KEY = os.environ.get('SECRET_KEY')  # Must be set in production
     
-    # Use Redis for rate limiting in production
-    RATELIMIT_STORAGE_URL = os.environ.get('REDIS_URL') or 'redis://localhost:6379/0'
+    # Use Redis for rate limiting in production so limits are shared
+    # across gunicorn workers instead of tracked per process.
+    RATELIMIT_STORAGE_URI = os.environ.get('REDIS_URL') or 'redis://localhost:6379/0'
 
 
 config = {
@@ -1,27 +1,36 @@
 #!/usr/bin/env python3
+import atexit
 import os
 import argparse
 import logging
-import subprocess
-import time
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("tweedhat.log"),
-        logging.StreamHandler()
-    ]
-)
+# Set up logging. Records go through an in-memory queue; a background
+# listener thread does the actual file/stream writes, so chatty scrape
+# loops pay an enqueue instead of a write syscall per line.
+_log_queue = queue.SimpleQueue()
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler("tweedhat.log"), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_listener = QueueListener(_log_queue, *_log_handlers,
+                              respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
 # Define folder paths
-TWEETS_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tweets")
-IMAGES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
-AUDIO_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tweet_audio")
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TWEETS_FOLDER = os.path.join(_BASE_DIR, "tweets")
+IMAGES_FOLDER = os.path.join(_BASE_DIR, "images")
+AUDIO_FOLDER = os.path.join(_BASE_DIR, "tweet_audio")
 
 # Create folders if they don't exist
 os.makedirs(TWEETS_FOLDER, exist_ok=True)
@@ -46,56 +55,61 @@ def run_scraper(username, max_tweets=None, visible=False, debug=False, email=Non
     """
     logger.info(f"Scraping tweets from {username}...")
     
-    # Build the command
-    cmd = ["python", "scrape.py", username]
-    
-    if max_tweets:
-        cmd.extend(["--max", str(max_tweets)])
-    
-    if visible:
-        cmd.append("--visible")
-    
     if debug:
-        cmd.append("--debug")
+        logging.getLogger().setLevel(logging.DEBUG)
     
-    if email:
-        cmd.extend(["--email", email])
-    
-    if password:
-        cmd.extend(["--password", password])
-    
-    if no_profile:
-        cmd.append("--no-profile")
-    
-    # Run the scraper
+    # Run the scraper in-process: no interpreter startup, no re-imported
+    # selenium stack, and save_tweets hands back the JSON path directly
+    # instead of being fished out of subprocess stdout
     try:
-        logger.info(f"Running command: {' '.join(cmd)}")
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        from scrape import TweetScraper
         
-        # Extract the output file path from the log
-        for line in result.stdout.split('\n'):
-            if "Successfully saved tweets to" in line:
-                json_file = line.split("Successfully saved tweets to")[1].strip()
-                logger.info(f"Tweets saved to {json_file}")
-                return json_file
+        scraper = TweetScraper(
+            username=username,
+            headless=not visible,
+            max_tweets=max_tweets,
+            email=email,
+            password=password,
+            use_profile=not no_profile
+        )
+        try:
+            tweets = scraper.scrape_tweets()
+            if tweets:
+                json_file = scraper.save_tweets(tweets)
+                if json_file:
+                    logger.info(f"Tweets saved to {json_file}")
+                    return json_file
+        finally:
+            scraper.close()
         
-        # If we couldn't find the output file path, look for the most recent file in the tweets folder
-        logger.warning("Could not find the output file path in the scraper output")
-        tweet_files = [f for f in os.listdir(TWEETS_FOLDER) if f.startswith(f"{username}_tweets_") and f.endswith(".json")]
-        if tweet_files:
-            # Sort by modification time, newest first
-            tweet_files.sort(key=lambda x: os.path.getmtime(os.path.join(TWEETS_FOLDER, x)), reverse=True)
-            json_file = os.path.join(TWEETS_FOLDER, tweet_files[0])
+        # If saving failed, look for the most recent file in the tweets folder
+        logger.warning("Scraper did not report an output file")
+        json_file = _latest_tweet_file(username)
+        if json_file:
             logger.info(f"Using most recent tweet file: {json_file}")
             return json_file
         
         logger.error("No tweet files found for this user")
         return None
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         logger.error(f"Error running scraper: {e}")
-        logger.error(f"Scraper stderr: {e.stderr}")
         return None
 
+
+def _latest_tweet_file(username):
+    """Return the newest tweets JSON for a username, or None."""
+    prefix = f"{username}_tweets_"
+    best = None
+    best_mtime = -1.0
+    with os.scandir(TWEETS_FOLDER) as it:
+        for entry in it:
+            if entry.name.startswith(prefix) and entry.name.endswith(".json"):
+                mtime = entry.stat().st_mtime
+                if mtime > best_mtime:
+                    best_mtime = mtime
+                    best = entry.path
+    return best
+
 def run_reader(json_file, voice_id=None, save_audio=False, output_dir=None, delay=2, max_tweets=None, debug=False, describe_images=False):
     """
     Run the tweet reader to read tweets aloud.
@@ -115,48 +129,27 @@ def run_reader(json_file, voice_id=None, save_audio=False, output_dir=None, dela
     """
     logger.info(f"Reading tweets from {json_file}...")
     
-    # If json_file doesn't include the full path and is not in the current directory,
-    # check if it's in the tweets folder
-    if not os.path.isabs(json_file) and not os.path.exists(json_file):
-        tweets_path = os.path.join(TWEETS_FOLDER, json_file)
-        if os.path.exists(tweets_path):
-            json_file = tweets_path
-            logger.info(f"Found tweet file in tweets folder: {json_file}")
-    
-    # Build the command
-    cmd = ["python", "read_tweets.py", json_file]
-    
-    if voice_id:
-        cmd.extend(["--voice-id", voice_id])
-    
-    if save_audio:
-        cmd.append("--save-audio")
-    
-    if output_dir:
-        cmd.extend(["--output-dir", output_dir])
-    else:
-        # Use the default audio folder if not specified
-        cmd.extend(["--output-dir", AUDIO_FOLDER])
-    
-    if delay != 2:  # Only add if not the default
-        cmd.extend(["--delay", str(delay)])
-    
-    if max_tweets:
-        cmd.extend(["--max-tweets", str(max_tweets)])
-    
     if debug:
-        cmd.append("--debug")
-    
-    if describe_images:
-        cmd.append("--describe-images")
+        logging.getLogger().setLevel(logging.DEBUG)
     
-    # Run the reader
+    # Run the reader in-process instead of spawning a second interpreter
     try:
-        logger.info(f"Running command: {' '.join(cmd)}")
-        subprocess.run(cmd, check=True)
+        from read_tweets import TweetReader
+        
+        kwargs = {
+            'json_file': json_file,
+            'save_audio': save_audio,
+            'output_dir': output_dir or AUDIO_FOLDER,
+            'describe_images': describe_images,
+        }
+        if voice_id:
+            kwargs['voice_id'] = voice_id
+        
+        reader = TweetReader(**kwargs)
+        reader.read_all_tweets(delay=delay, max_tweets=max_tweets)
         logger.info("Tweet reading completed successfully")
         return True
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         logger.error(f"Error running reader: {e}")
         return False
 
@@ -169,12 +162,14 @@ def list_voices():
     """
     logger.info("Listing available voices...")
     
-    # Run the reader with --list-voices option
     try:
+        from read_tweets import TweetReader
+        
         # Use example_tweet.json as a placeholder
-        subprocess.run(["python", "read_tweets.py", "example_tweet.json", "--list-voices"], check=True)
+        reader = TweetReader(json_file="example_tweet.json")
+        reader.list_available_voices()
         return True
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         logger.error(f"Error listing voices: {e}")
         return False
 
@@ -232,9 +227,6 @@ def main():
         if not json_file:
             logger.error("Failed to scrape tweets. Exiting.")
             return
-        
-        # Give a moment for the file to be fully written
-        time.sleep(1)
     
     # Read the tweets
     run_reader(